@@ -4,17 +4,34 @@
 """
 
 import os
+import copy
 import yaml
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from cryptography.fernet import Fernet
 import base64
+import hashlib
 import json
 from ..utils.enhanced_logger import get_logger
 
 logger = get_logger(__name__)
 
+# LibYAML (C実装) が利用可能なら高速なローダーを使用
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 解析済みYAMLのキャッシュ: パス -> ((mtime_ns, size), 設定辞書)
+_YAML_CACHE: "OrderedDict[Path, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+
+# テンプレート保存時にYAMLと並べて書き出すJSONスナップショット
+# 元YAMLのSHA-256を埋め込み、現在のYAML内容と完全一致する場合のみ優先する
+# （更新時刻の粒度が粗いファイルシステムや、無関係な同名JSONを誤って使わないため）
+_JSON_SNAPSHOT_SUFFIX = ".json"
+_JSON_SNAPSHOT_SOURCE_KEY = "source_sha256"
+_JSON_SNAPSHOT_DATA_KEY = "config"
+
 
 @dataclass
 class DataAcquisitionConfig:
@@ -331,12 +348,46 @@ class ConfigManager:
             return {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            stat = file_path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            
+            # 更新時刻・サイズが変わっていなければ解析済みの結果を再利用
+            cached = _YAML_CACHE.get(file_path)
+            if cached is not None and cached[0] == signature:
+                _YAML_CACHE.move_to_end(file_path)
+                return copy.deepcopy(cached[1])
+            
+            raw = file_path.read_bytes()
+            data = self._load_json_snapshot(file_path, raw)
+            if data is None:
+                data = yaml.load(raw, Loader=_YAML_LOADER) or {}
+            
+            _YAML_CACHE[file_path] = (signature, data)
+            _YAML_CACHE.move_to_end(file_path)
+            if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+                _YAML_CACHE.popitem(last=False)
+            
+            return copy.deepcopy(data)
         except Exception as e:
             logger.error(f"Failed to load YAML file: {file_path}", error=e)
             return {}
     
+    def _load_json_snapshot(self, yaml_path: Path, yaml_content: bytes) -> Optional[Dict[str, Any]]:
+        """YAMLと同内容のJSONスナップショットの読み込み（内容が一致しない・不正な場合はNone）"""
+        snapshot_path = yaml_path.with_suffix(_JSON_SNAPSHOT_SUFFIX)
+        try:
+            snapshot = json.loads(snapshot_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(snapshot, dict):
+            return None
+        if snapshot.get(_JSON_SNAPSHOT_SOURCE_KEY) != hashlib.sha256(yaml_content).hexdigest():
+            return None
+        
+        data = snapshot.get(_JSON_SNAPSHOT_DATA_KEY)
+        return data if isinstance(data, dict) else None
+    
     def _load_env_secrets(self) -> Dict[str, str]:
         """環境変数からの秘密情報読み込み"""
         secret_keys = [
@@ -497,8 +548,15 @@ class ConfigManager:
             file_path = self.config_dir / filename
             if not file_path.exists():
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        yaml.dump(template, f, default_flow_style=False, allow_unicode=True)
+                    # 改行変換を避けるためバイト列で書き出し、同じバイト列のハッシュを記録
+                    content = yaml.dump(template, default_flow_style=False, allow_unicode=True).encode('utf-8')
+                    file_path.write_bytes(content)
+                    snapshot = {
+                        _JSON_SNAPSHOT_SOURCE_KEY: hashlib.sha256(content).hexdigest(),
+                        _JSON_SNAPSHOT_DATA_KEY: template
+                    }
+                    with open(file_path.with_suffix(_JSON_SNAPSHOT_SUFFIX), 'w', encoding='utf-8') as f:
+                        json.dump(snapshot, f, ensure_ascii=False)
                     logger.info(f"Created config template: {filename}")
                 except Exception as e:
                     logger.error(f"Failed to create template: {filename}", error=e)
@@ -3,11 +3,23 @@
 現在の問題「�A�I�L�������̃��X�g」→「アオキ買い物リスト」を解決
 """
 
+import os
 import re
 import unicodedata
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
-import chardet
+
+# エンコーディング検出: C実装のcchardet → chardet の順で利用（いずれも detect() を提供）
+# charset-normalizer は短いUTF-8文字列を cp932 等と判定し、再デコードで文字化けさせるため使用しない
+try:
+    import cchardet as chardet
+except ImportError:
+    try:
+        import chardet
+    except ImportError:
+        chardet = None
+
 from ..utils.enhanced_logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,9 +28,13 @@ logger = get_logger(__name__)
 class EncodingHandler:
     """文字化け修正・エンコーディング処理クラス"""
     
+    # この件数未満のバッチはスレッド起動コストの方が大きいため逐次処理
+    PARALLEL_BATCH_THRESHOLD = 8
+    
     def __init__(self):
         # 文字化けパターンとその修正マッピング
         self.repair_patterns = self._initialize_repair_patterns()
+        self._repair_stages = self._compile_repair_patterns(self.repair_patterns)
         self.encoding_detectors = ['utf-8', 'shift_jis', 'euc-jp', 'iso-2022-jp', 'cp932']
         
     def _initialize_repair_patterns(self) -> Dict[str, str]:
@@ -68,6 +84,58 @@ class EncodingHandler:
             r'���C��': 'ライ',
         }
     
+    @staticmethod
+    def _compile_repair_patterns(patterns: Dict[str, str]) -> List[Tuple[str, Callable[[str], str]]]:
+        """修正パターンを適用順を保ったまま一括置換ステージに事前コンパイル
+        
+        連続する1文字キーは str.translate テーブル、複数文字のリテラルキーは
+        1つの選択パターン正規表現にまとめる。キー同士が重なり得る場合や
+        正規表現キーの前後でステージを区切るため、逐次 re.sub と同じ結果になる。
+        """
+        stages: List[Tuple[str, Callable[[str], str]]] = []
+        group: Dict[str, str] = {}
+        
+        def overlaps(a: str, b: str) -> bool:
+            if a in b or b in a:
+                return True
+            return any(a.endswith(b[:i]) or b.endswith(a[:i]) for i in range(1, min(len(a), len(b))))
+        
+        def flush():
+            if not group:
+                return
+            table = dict(group)
+            label = "|".join(table)
+            if all(len(key) == 1 for key in table):
+                trans = str.maketrans(table)
+                stages.append((label, lambda text: text.translate(trans)))
+            else:
+                regex = re.compile("|".join(re.escape(key) for key in table))
+                stages.append((label, lambda text: regex.sub(lambda m: table[m.group()], text)))
+            group.clear()
+        
+        for pattern, replacement in patterns.items():
+            is_literal = not any(c in pattern for c in '.^$*+?{}[]\\|()')
+            if not is_literal or not replacement:
+                # 正規表現キー・削除パターンは単独ステージ（置換結果で新たな一致が生じ得るため）
+                flush()
+                try:
+                    regex = re.compile(pattern)
+                except re.error as e:
+                    logger.debug(f"Pattern compile failed for {pattern}: {e}")
+                    continue
+                stages.append((pattern, lambda text, regex=regex, replacement=replacement: regex.sub(replacement, text)))
+                continue
+            
+            if group and (
+                (len(pattern) == 1) != (len(next(iter(group))) == 1)
+                or any(overlaps(pattern, key) for key in group)
+            ):
+                flush()
+            group[pattern] = replacement
+        
+        flush()
+        return stages
+    
     def fix_garbled_text(self, text: str) -> str:
         """文字化けテキストの修正"""
         if not text or not isinstance(text, str):
@@ -110,13 +178,21 @@ class EncodingHandler:
     
     def _detect_and_fix_encoding(self, text: str) -> str:
         """エンコーディング検出と修正"""
+        # ASCIIのみのテキストはどのエンコーディングでも同一のため検出不要
+        if text.isascii():
+            return text
+        
+        # 検出ライブラリが無い場合は再デコードせずパターン修正のみに任せる
+        if chardet is None:
+            return text
+        
         # chardetを使用してエンコーディングを検出
         try:
             # テキストをバイト形式に変換して検出
             text_bytes = text.encode('utf-8', errors='ignore')
             detected = chardet.detect(text_bytes)
             
-            if detected and detected['confidence'] > 0.7:
+            if detected and (detected['confidence'] or 0) > 0.7:
                 detected_encoding = detected['encoding']
                 logger.debug(f"Detected encoding: {detected_encoding} (confidence: {detected['confidence']})")
                 
@@ -136,11 +212,11 @@ class EncodingHandler:
     
     def _apply_repair_patterns(self, text: str) -> str:
         """修正パターンの適用"""
-        for pattern, replacement in self.repair_patterns.items():
+        for label, apply_stage in self._repair_stages:
             try:
-                text = re.sub(pattern, replacement, text)
+                text = apply_stage(text)
             except Exception as e:
-                logger.debug(f"Pattern repair failed for {pattern}: {e}")
+                logger.debug(f"Pattern repair failed for {label}: {e}")
         
         return text
     
@@ -222,30 +298,34 @@ class EncodingHandler:
         
         return fixed_event
     
-    def batch_fix_events(self, events: List[Dict]) -> List[Dict]:
-        """イベントデータのバッチ修正"""
+    def _fix_one_event(self, index: int, event: Dict) -> Tuple[Dict, bool]:
+        """1イベントの修正（失敗時は元のイベントを返す）"""
+        try:
+            fixed_event = self.auto_fix_event_data(event)
+            # 修正があったかチェック
+            return fixed_event, fixed_event != event
+        except Exception as e:
+            logger.error(
+                f"Failed to fix event {index}",
+                error=e,
+                event_id=event.get('id', 'unknown'),
+                operation="batch_encoding_fix"
+            )
+            return event, False  # 修正失敗時は元のイベントを使用
+    
+    def batch_fix_events(self, events: List[Dict], workers: Optional[int] = None) -> List[Dict]:
+        """イベントデータのバッチ修正（一定件数以上はスレッドプールで並列処理）"""
         logger.info(f"Starting batch encoding fix for {len(events)} events")
         
-        fixed_events = []
-        fix_count = 0
+        if len(events) < self.PARALLEL_BATCH_THRESHOLD or workers == 1:
+            results = [self._fix_one_event(i, event) for i, event in enumerate(events)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                # map は入力順で結果を返すため、並び順は逐次処理と同一
+                results = list(executor.map(self._fix_one_event, range(len(events)), events))
         
-        for i, event in enumerate(events):
-            try:
-                fixed_event = self.auto_fix_event_data(event)
-                fixed_events.append(fixed_event)
-                
-                # 修正があったかチェック
-                if fixed_event != event:
-                    fix_count += 1
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to fix event {i}",
-                    error=e,
-                    event_id=event.get('id', 'unknown'),
-                    operation="batch_encoding_fix"
-                )
-                fixed_events.append(event)  # 修正失敗時は元のイベントを使用
+        fixed_events = [fixed_event for fixed_event, _ in results]
+        fix_count = sum(1 for _, changed in results if changed)
         
         logger.info(
             f"Batch encoding fix completed",
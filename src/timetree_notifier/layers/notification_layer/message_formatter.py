@@ -11,6 +11,8 @@ from enum import Enum
 from abc import ABC, abstractmethod
 import logging
 
+from ...utils.compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,9 +37,9 @@ class ChannelFormat(Enum):
     EMAIL_HTML = "email_html"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EventData:
-    """イベントデータ"""
+    """イベントデータ（不変）"""
     title: str
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
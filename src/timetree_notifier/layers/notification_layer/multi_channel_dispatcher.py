@@ -262,6 +262,7 @@ class NotificationDispatcher:
         # バックグラウンドタスク管理
         self.background_tasks: Set[asyncio.Task] = set()
         self.is_running = False
+        self._retry_slots: Optional[asyncio.Semaphore] = None
         
         # 統計情報
         self.total_messages = 0
@@ -416,6 +417,9 @@ class NotificationDispatcher:
         
         self.is_running = True
         
+        # 同時に処理するリトライタスク数の上限
+        self._retry_slots = asyncio.Semaphore(self.max_concurrent)
+        
         # リトライ処理タスク
         retry_task = asyncio.create_task(self._retry_processor())
         self.background_tasks.add(retry_task)
@@ -426,11 +430,12 @@ class NotificationDispatcher:
         """バックグラウンド処理停止"""
         self.is_running = False
         
-        # 実行中タスクの停止
-        for task in self.background_tasks:
+        # 実行中タスクの停止（リトライタスクは完了時に集合から外れるためコピーして扱う）
+        tasks = list(self.background_tasks)
+        for task in tasks:
             task.cancel()
         
-        await asyncio.gather(*self.background_tasks, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
         self.background_tasks.clear()
         
         logger.info("Background notification processing stopped")
@@ -444,15 +449,15 @@ class NotificationDispatcher:
                     self.retry_queue.get(), timeout=1.0
                 )
                 
-                # 指数バックオフで待機
-                backoff_base = self.retry_policy.get('backoff_base', 2.0)
-                wait_time = backoff_base ** retry_message.retry_count
-                
-                logger.info(f"Waiting {wait_time}s before retry for {retry_message.id}")
-                await asyncio.sleep(wait_time)
-                
-                # リトライ実行
-                await self.dispatch_notification(retry_message)
+                # リトライはメッセージごとに独立タスクとして並行実行
+                # （バックオフ待機中も後続のリトライを滞留させない）
+                # 同時実行数は max_concurrent まで。上限到達中は空きが出るまで待つ
+                retry_slots = self._retry_slots
+                await retry_slots.acquire()
+                retry_task = asyncio.create_task(self._retry_delivery(retry_message))
+                self.background_tasks.add(retry_task)
+                retry_task.add_done_callback(self.background_tasks.discard)
+                retry_task.add_done_callback(lambda _task: retry_slots.release())
                 
             except asyncio.TimeoutError:
                 continue
@@ -460,6 +465,24 @@ class NotificationDispatcher:
                 logger.error(f"Error in retry processor: {e}")
                 await asyncio.sleep(5)  # エラー時は5秒待機
     
+    async def _retry_delivery(self, retry_message: NotificationMessage):
+        """単一メッセージのリトライ（指数バックオフ後に再配信）"""
+        try:
+            # 指数バックオフで待機
+            backoff_base = self.retry_policy.get('backoff_base', 2.0)
+            wait_time = backoff_base ** retry_message.retry_count
+            
+            logger.info(f"Waiting {wait_time}s before retry for {retry_message.id}")
+            await asyncio.sleep(wait_time)
+            
+            # リトライ実行（対象チャンネルへは _dispatch_to_channels で並行配信）
+            await self.dispatch_notification(retry_message)
+            
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Retry failed for {retry_message.id}: {e}")
+    
     def get_statistics(self) -> Dict[str, Any]:
         """配信システム統計情報"""
         channel_stats = {name: ch.get_statistics() for name, ch in self.channels.items()}
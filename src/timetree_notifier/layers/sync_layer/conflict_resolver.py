@@ -10,6 +10,22 @@ from enum import Enum
 import logging
 import hashlib
 
+# 高速なテキスト類似度計算（C++実装）
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# 類似度行列のベクトル化計算
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_EPOCH = datetime(1970, 1, 1)
+
 logger = logging.getLogger(__name__)
 
 
@@ -152,9 +168,14 @@ class ConflictResolver:
         """競合を検出"""
         conflicts = []
         
+        # 全ペアの類似度を一括計算（TT × GC 行列）
+        similarity_matrix = self._similarity_matrix(timetree_events, google_events)
+        
         # TimeTreeイベントに対応するGoogle Calendarイベントを探す
-        for tt_event in timetree_events:
-            matching_gc_events = self._find_matching_google_events(tt_event, google_events)
+        for i, tt_event in enumerate(timetree_events):
+            matching_gc_events = self._find_matching_google_events(
+                tt_event, google_events, similarity_matrix[i] if similarity_matrix is not None else None
+            )
             
             for gc_event in matching_gc_events:
                 conflict_items = self._compare_events(tt_event, gc_event)
@@ -170,11 +191,12 @@ class ConflictResolver:
         
         return conflicts
     
-    def _find_matching_google_events(self, tt_event: Any, google_events: List[Any]) -> List[Any]:
+    def _find_matching_google_events(self, tt_event: Any, google_events: List[Any],
+                                     similarity_row: Optional[Any] = None) -> List[Any]:
         """TimeTreeイベントに対応するGoogle Calendarイベントを検索"""
         matches = []
         
-        for gc_event in google_events:
+        for j, gc_event in enumerate(google_events):
             # 1. TimeTree IDによる直接マッチ
             if (hasattr(gc_event, 'source_event_id') and 
                 gc_event.source_event_id and 
@@ -183,7 +205,10 @@ class ConflictResolver:
                 continue
             
             # 2. タイトル・時刻による類似性マッチ
-            similarity_score = self._calculate_similarity(tt_event, gc_event)
+            if similarity_row is not None:
+                similarity_score = similarity_row[j]
+            else:
+                similarity_score = self._calculate_similarity(tt_event, gc_event)
             if similarity_score >= self.similarity_threshold:
                 matches.append(gc_event)
         
@@ -218,6 +243,72 @@ class ConflictResolver:
         
         return sum(scores) / len(scores) if scores else 0.0
     
+    def _similarity_matrix(self, timetree_events: List[Any], google_events: List[Any]) -> Optional[Any]:
+        """全イベントペアの類似性スコア行列（_calculate_similarity と同一の値）
+        
+        numpy / rapidfuzz が利用できない場合は None を返し、ペア毎の計算にフォールバックする。
+        """
+        if not (NUMPY_AVAILABLE and RAPIDFUZZ_AVAILABLE) or not timetree_events or not google_events:
+            return None
+        
+        try:
+            # タイトル・場所類似性
+            title_sim = self._text_similarity_matrix(
+                [getattr(e, 'title', '').strip() for e in timetree_events],
+                [getattr(e, 'summary', '').replace('📱 ', '').strip() for e in google_events]
+            )
+            location_sim = self._text_similarity_matrix(
+                [getattr(e, 'location', '') or '' for e in timetree_events],
+                [getattr(e, 'location', '') or '' for e in google_events]
+            )
+            
+            # 時刻類似性（開始時刻が両方ある組のみスコアに含める）
+            tt_starts = [getattr(e, 'start_time', None) for e in timetree_events]
+            gc_starts = [getattr(e, 'start', None) for e in google_events]
+            tt_seconds = np.array([self._to_seconds(t) if t else np.nan for t in tt_starts], dtype=np.float64)
+            gc_seconds = np.array([self._to_seconds(t) if t else np.nan for t in gc_starts], dtype=np.float64)
+            
+            has_time = np.isfinite(tt_seconds)[:, None] & np.isfinite(gc_seconds)[None, :]
+            time_diff = np.abs(np.subtract.outer(tt_seconds, gc_seconds))
+            time_sim = np.where(has_time, np.maximum(0.0, 1.0 - time_diff / 3600), 0.0)  # 1時間で類似度0
+            
+            weighted = title_sim * 0.4 + time_sim * 0.4 + location_sim * 0.2
+            return weighted / np.where(has_time, 3.0, 2.0)
+        
+        except Exception as e:
+            logger.debug(f"Vectorized similarity failed, falling back to pairwise: {e}")
+            return None
+    
+    @staticmethod
+    def _to_seconds(value: datetime) -> float:
+        """日時を秒に変換（naive な日時はそのまま差分が取れるよう UTC 扱い）"""
+        if value.tzinfo is None:
+            return (value - _EPOCH).total_seconds()
+        return value.timestamp()
+    
+    def _text_similarity_matrix(self, texts1: List[str], texts2: List[str]) -> Any:
+        """_text_similarity の行列版"""
+        raw1 = np.array(texts1, dtype=object)[:, None]
+        raw2 = np.array(texts2, dtype=object)[None, :]
+        norm1 = np.array([t.lower().strip() for t in texts1], dtype=str)[:, None]
+        norm2 = np.array([t.lower().strip() for t in texts2], dtype=str)[None, :]
+        
+        scores = process.cdist(
+            norm1[:, 0].tolist(), norm2[0].tolist(),
+            scorer=fuzz.token_set_ratio, dtype=np.float64, workers=-1
+        ) / 100.0
+        
+        substring = (np.char.find(norm2, norm1) >= 0) | (np.char.find(norm1, norm2) >= 0)
+        empty1 = raw1 == ''
+        empty2 = raw2 == ''
+        
+        # _text_similarity と同じ優先順位で規則を適用
+        scores = np.where(substring, 0.8, scores)
+        scores = np.where(norm1 == norm2, 1.0, scores)
+        scores = np.where(empty1 | empty2, 0.0, scores)
+        scores = np.where(empty1 & empty2, 1.0, scores)
+        return scores
+    
     def _text_similarity(self, text1: str, text2: str) -> float:
         """テキスト類似性計算（簡易版）"""
         if not text1 and not text2:
@@ -235,7 +326,10 @@ class ConflictResolver:
         if text1 in text2 or text2 in text1:
             return 0.8
         
-        # 共通文字数ベースの類似性
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.token_set_ratio(text1, text2) / 100.0
+        
+        # 共通文字数ベースの類似性（rapidfuzz 未インストール時）
         common_chars = len(set(text1) & set(text2))
         total_chars = len(set(text1) | set(text2))
         
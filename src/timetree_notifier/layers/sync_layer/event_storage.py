@@ -7,14 +7,17 @@ import sqlite3
 import asyncio
 import aiosqlite
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Any, Union
 from enum import Enum
 from pathlib import Path
 import logging
 import hashlib
 
+from ...utils.compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +37,7 @@ class NotificationStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StoredEvent:
     """ストレージイベント"""
     id: str
@@ -110,14 +113,103 @@ class NotificationQueue:
 
 
 class EventStorage:
-    """イベントストレージ管理システム"""
+    """イベントストレージ管理システム
+    
+    全操作で1本のaiosqlite接続（専用ワーカースレッド付き）を共有する。
+    使用後は ``await storage.close()`` または ``async with EventStorage(...) as storage:``
+    で接続を閉じること。閉じ忘れた場合も、接続を開いたイベントループの
+    終了処理（asyncio.run 終了時の shutdown_asyncgens）で自動的にクローズされる。
+    """
+    
+    _INSERT_EVENT_SQL = """
+        INSERT INTO events (
+            id, title, start_datetime, end_datetime, is_all_day,
+            description, location, source_hash, created_at, updated_at,
+            sync_status, google_calendar_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+    
+    _UPDATE_EVENT_SQL = """
+        UPDATE events SET
+            title = ?, start_datetime = ?, end_datetime = ?, is_all_day = ?,
+            description = ?, location = ?, source_hash = ?, updated_at = ?,
+            sync_status = ?, google_calendar_id = ?
+        WHERE id = ?
+        """
+    
+    _INSERT_SYNC_LOG_SQL = """
+        INSERT INTO sync_logs (event_id, action, source, target, status, error_message)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """
+    
+    # IN句1回あたりのID数（SQLite 3.32未満のバインド変数上限999未満に抑える）
+    _ID_LOOKUP_CHUNK_SIZE = 500
     
     def __init__(self, database_path: Union[str, Path] = "data/events.db"):
-        self.database_path = Path(database_path)
-        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        # "file:" で始まる文字列は SQLite URI として扱う
+        # 例: "file:teststorage?mode=memory&cache=shared"（インメモリDB）
+        self._is_uri = isinstance(database_path, str) and database_path.startswith("file:")
+        
+        if self._is_uri:
+            self.database_path: Union[str, Path] = database_path
+        else:
+            self.database_path = Path(database_path)
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # 接続プール（非同期）
+        # 接続プール（非同期）: 全操作で共有する永続接続
+        # インメモリDBは全接続が閉じると消えるため、この接続がDBの生存期間も兼ねる
         self._connection_pool: Optional[aiosqlite.Connection] = None
+        self._connection_lock: Optional[asyncio.Lock] = None
+        self._shutdown_guard: Optional[AsyncGenerator[None, None]] = None
+    
+    def _connect(self) -> aiosqlite.Connection:
+        """データベース接続（URIの場合は uri=True で接続）"""
+        return aiosqlite.connect(self.database_path, uri=self._is_uri)
+    
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """永続接続のオープンとPRAGMA設定"""
+        db = await self._connect()
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA synchronous=NORMAL")
+        await db.execute("PRAGMA temp_store=MEMORY")
+        db.row_factory = aiosqlite.Row
+        
+        # ループ終了時のクローズを登録（close() 忘れでワーカースレッドが残り、終了時に固まるのを防ぐ）
+        self._shutdown_guard = self._close_on_loop_shutdown(db)
+        await self._shutdown_guard.__anext__()
+        return db
+    
+    async def _close_on_loop_shutdown(self, db: aiosqlite.Connection) -> AsyncGenerator[None, None]:
+        """イベントループの shutdown_asyncgens() で aclose() され、接続をクローズする"""
+        try:
+            yield
+        finally:
+            # 再接続後に古いガードが回収された場合は新しい接続を閉じない
+            if self._connection_pool is db:
+                await self.close()
+    
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """永続接続の取得（操作単位で排他し、失敗時はロールバック）"""
+        if self._connection_lock is None:
+            self._connection_lock = asyncio.Lock()
+        
+        async with self._connection_lock:
+            if self._connection_pool is None:
+                self._connection_pool = await self._open_connection()
+            
+            try:
+                yield self._connection_pool
+            except BaseException:
+                # キャンセル時も途中までの変更を共有接続に残さない
+                await self._connection_pool.rollback()
+                raise
+    
+    async def __aenter__(self) -> "EventStorage":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
     
     async def initialize(self) -> bool:
         """データベース初期化"""
@@ -185,7 +277,7 @@ class EventStorage:
         )
         """
         
-        async with aiosqlite.connect(self.database_path) as db:
+        async with self._connection() as db:
             await db.execute(events_table_sql)
             await db.execute(sync_logs_table_sql)
             await db.execute(notification_queue_table_sql)
@@ -195,7 +287,10 @@ class EventStorage:
         """インデックス作成"""
         indexes_sql = [
             "CREATE INDEX IF NOT EXISTS idx_events_start_datetime ON events(start_datetime)",
-            "CREATE INDEX IF NOT EXISTS idx_events_sync_status ON events(sync_status)",
+            # ステータス＋日付範囲の絞り込みと start_datetime 順の並べ替えを1つの索引で処理
+            # （先頭列が sync_status のため単一列索引は不要。既存DBからは削除）
+            "DROP INDEX IF EXISTS idx_events_sync_status",
+            "CREATE INDEX IF NOT EXISTS idx_events_sync_status_start ON events(sync_status, start_datetime)",
             "CREATE INDEX IF NOT EXISTS idx_events_source_hash ON events(source_hash)",
             "CREATE INDEX IF NOT EXISTS idx_sync_logs_event_id ON sync_logs(event_id)",
             "CREATE INDEX IF NOT EXISTS idx_sync_logs_timestamp ON sync_logs(timestamp)",
@@ -203,7 +298,7 @@ class EventStorage:
             "CREATE INDEX IF NOT EXISTS idx_notification_queue_status ON notification_queue(status)"
         ]
         
-        async with aiosqlite.connect(self.database_path) as db:
+        async with self._connection() as db:
             for index_sql in indexes_sql:
                 await db.execute(index_sql)
             await db.commit()
@@ -211,7 +306,7 @@ class EventStorage:
     async def store_event(self, event: StoredEvent) -> bool:
         """イベントの保存"""
         try:
-            async with aiosqlite.connect(self.database_path) as db:
+            async with self._connection() as db:
                 # 既存イベントチェック
                 existing = await self._get_event_by_id(event.id, db)
                 
@@ -235,42 +330,85 @@ class EventStorage:
             logger.error(f"Failed to store event {event.id}: {e}")
             return False
     
-    async def _insert_event(self, event: StoredEvent, db: aiosqlite.Connection):
-        """新規イベント挿入"""
-        sql = """
-        INSERT INTO events (
-            id, title, start_datetime, end_datetime, is_all_day,
-            description, location, source_hash, created_at, updated_at,
-            sync_status, google_calendar_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+    async def store_events(self, events: List[StoredEvent]) -> bool:
+        """複数イベントの一括保存（1トランザクション・executemany）"""
+        events = list(events)
+        if not events:
+            return True
+        if len(events) == 1:
+            return await self.store_event(events[0])
         
-        await db.execute(sql, (
+        try:
+            async with self._connection() as db:
+                # 既存イベントを一括チェック（バインド変数の上限に合わせて分割）
+                ids = list({event.id for event in events})
+                known_ids = set()
+                for i in range(0, len(ids), self._ID_LOOKUP_CHUNK_SIZE):
+                    chunk = ids[i:i + self._ID_LOOKUP_CHUNK_SIZE]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    cursor = await db.execute(f"SELECT id FROM events WHERE id IN ({placeholders})", chunk)
+                    known_ids.update(row[0] for row in await cursor.fetchall())
+                
+                insert_rows = []
+                update_rows = []
+                log_rows = []
+                for event in events:
+                    if event.id in known_ids:
+                        update_rows.append(self._update_params(event))
+                        action = "UPDATE"
+                    else:
+                        insert_rows.append(self._insert_params(event))
+                        known_ids.add(event.id)
+                        action = "CREATE"
+                    log_rows.append((event.id, action, "timetree", "local_storage", SyncStatus.SUCCESS.value, None))
+                
+                # 新規挿入を先に行うことで、同一バッチ内の重複IDは後続の更新で上書きされる
+                if insert_rows:
+                    await db.executemany(self._INSERT_EVENT_SQL, insert_rows)
+                if update_rows:
+                    await db.executemany(self._UPDATE_EVENT_SQL, update_rows)
+                
+                # 同期ログ記録
+                await db.executemany(self._INSERT_SYNC_LOG_SQL, log_rows)
+                
+                await db.commit()
+                logger.debug(f"Events stored: {len(insert_rows)} created, {len(update_rows)} updated")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to store {len(events)} events: {e}")
+            return False
+    
+    @staticmethod
+    def _insert_params(event: StoredEvent) -> tuple:
+        """挿入用パラメータ"""
+        return (
             event.id, event.title, event.start_datetime.isoformat(),
             event.end_datetime.isoformat() if event.end_datetime else None,
             event.is_all_day, event.description, event.location,
             event.source_hash, event.created_at.isoformat(),
             event.updated_at.isoformat(), event.sync_status.value,
             event.google_calendar_id
-        ))
+        )
     
-    async def _update_event(self, event: StoredEvent, db: aiosqlite.Connection):
-        """既存イベント更新"""
-        sql = """
-        UPDATE events SET
-            title = ?, start_datetime = ?, end_datetime = ?, is_all_day = ?,
-            description = ?, location = ?, source_hash = ?, updated_at = ?,
-            sync_status = ?, google_calendar_id = ?
-        WHERE id = ?
-        """
-        
-        await db.execute(sql, (
+    @staticmethod
+    def _update_params(event: StoredEvent) -> tuple:
+        """更新用パラメータ"""
+        return (
             event.title, event.start_datetime.isoformat(),
             event.end_datetime.isoformat() if event.end_datetime else None,
             event.is_all_day, event.description, event.location,
             event.source_hash, event.updated_at.isoformat(),
             event.sync_status.value, event.google_calendar_id, event.id
-        ))
+        )
+    
+    async def _insert_event(self, event: StoredEvent, db: aiosqlite.Connection):
+        """新規イベント挿入"""
+        await db.execute(self._INSERT_EVENT_SQL, self._insert_params(event))
+    
+    async def _update_event(self, event: StoredEvent, db: aiosqlite.Connection):
+        """既存イベント更新"""
+        await db.execute(self._UPDATE_EVENT_SQL, self._update_params(event))
     
     async def get_events(self, 
                         start_date: Optional[datetime] = None,
@@ -298,8 +436,7 @@ class EventStorage:
             where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
             sql = f"SELECT * FROM events{where_clause} ORDER BY start_datetime ASC"
             
-            async with aiosqlite.connect(self.database_path) as db:
-                db.row_factory = aiosqlite.Row
+            async with self._connection() as db:
                 cursor = await db.execute(sql, params)
                 rows = await cursor.fetchall()
                 
@@ -319,7 +456,6 @@ class EventStorage:
     async def _get_event_by_id(self, event_id: str, db: aiosqlite.Connection) -> Optional[StoredEvent]:
         """IDによるイベント取得"""
         sql = "SELECT * FROM events WHERE id = ?"
-        db.row_factory = aiosqlite.Row
         cursor = await db.execute(sql, (event_id,))
         row = await cursor.fetchone()
         
@@ -350,12 +486,7 @@ class EventStorage:
                              status: SyncStatus, error_message: Optional[str],
                              db: aiosqlite.Connection):
         """同期アクション記録"""
-        sql = """
-        INSERT INTO sync_logs (event_id, action, source, target, status, error_message)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """
-        
-        await db.execute(sql, (event_id, action, source, target, status.value, error_message))
+        await db.execute(self._INSERT_SYNC_LOG_SQL, (event_id, action, source, target, status.value, error_message))
     
     async def get_sync_logs(self, event_id: Optional[str] = None, limit: int = 100) -> List[SyncLog]:
         """同期ログ取得"""
@@ -367,8 +498,7 @@ class EventStorage:
                 sql = "SELECT * FROM sync_logs ORDER BY timestamp DESC LIMIT ?"
                 params = (limit,)
             
-            async with aiosqlite.connect(self.database_path) as db:
-                db.row_factory = aiosqlite.Row
+            async with self._connection() as db:
                 cursor = await db.execute(sql, params)
                 rows = await cursor.fetchall()
                 
@@ -402,7 +532,7 @@ class EventStorage:
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
             
-            async with aiosqlite.connect(self.database_path) as db:
+            async with self._connection() as db:
                 await db.execute(sql, (
                     notification.event_id,
                     notification.notification_type,
@@ -432,8 +562,7 @@ class EventStorage:
             ORDER BY scheduled_time ASC LIMIT ?
             """
             
-            async with aiosqlite.connect(self.database_path) as db:
-                db.row_factory = aiosqlite.Row
+            async with self._connection() as db:
                 cursor = await db.execute(sql, (datetime.now().isoformat(), limit))
                 rows = await cursor.fetchall()
                 
@@ -469,7 +598,7 @@ class EventStorage:
             WHERE id = ?
             """
             
-            async with aiosqlite.connect(self.database_path) as db:
+            async with self._connection() as db:
                 await db.execute(sql, (status.value, datetime.now().isoformat(), notification_id))
                 await db.commit()
                 return True
@@ -478,12 +607,18 @@ class EventStorage:
             logger.error(f"Failed to update notification status: {e}")
             return False
     
+    async def close(self):
+        """保持している接続のクローズ"""
+        db, self._connection_pool = self._connection_pool, None
+        if db is not None:
+            await db.close()
+    
     async def cleanup_old_data(self, retention_days: int = 30):
         """古いデータのクリーンアップ"""
         cutoff_date = datetime.now() - timedelta(days=retention_days)
         
         try:
-            async with aiosqlite.connect(self.database_path) as db:
+            async with self._connection() as db:
                 # 古い同期ログを削除
                 await db.execute("DELETE FROM sync_logs WHERE timestamp < ?", (cutoff_date.isoformat(),))
                 
@@ -505,7 +640,7 @@ class EventStorage:
         try:
             stats = {}
             
-            async with aiosqlite.connect(self.database_path) as db:
+            async with self._connection() as db:
                 # イベント統計
                 cursor = await db.execute("SELECT COUNT(*) FROM events")
                 stats['total_events'] = (await cursor.fetchone())[0]
@@ -522,7 +657,14 @@ class EventStorage:
                 stats['pending_notifications'] = (await cursor.fetchone())[0]
                 
                 # データベースサイズ
-                stats['database_size_mb'] = self.database_path.stat().st_size / (1024 * 1024)
+                if self._is_uri:
+                    cursor = await db.execute("PRAGMA page_count")
+                    page_count = (await cursor.fetchone())[0]
+                    cursor = await db.execute("PRAGMA page_size")
+                    page_size = (await cursor.fetchone())[0]
+                    stats['database_size_mb'] = page_count * page_size / (1024 * 1024)
+                else:
+                    stats['database_size_mb'] = self.database_path.stat().st_size / (1024 * 1024)
                 
             return stats
             
@@ -536,9 +678,18 @@ if __name__ == "__main__":
     async def test_event_storage():
         """イベントストレージのテスト"""
         
-        # テスト用ストレージ
-        storage = EventStorage("test_events.db")
+        # テスト用ストレージ（終了時に接続をクローズ）
+        async with EventStorage("test_events.db") as storage:
+            await run_storage_checks(storage)
         
+        # テストファイル削除
+        import os
+        if os.path.exists("test_events.db"):
+            os.remove("test_events.db")
+            print("✅ Test database cleaned up")
+    
+    async def run_storage_checks(storage: EventStorage):
+        """ストレージ各機能の動作確認"""
         if not await storage.initialize():
             print("Failed to initialize storage")
             return
@@ -573,12 +724,6 @@ if __name__ == "__main__":
         # 統計情報
         stats = await storage.get_storage_statistics()
         print(f"✅ Storage statistics: {stats}")
-        
-        # テストファイル削除
-        import os
-        if os.path.exists("test_events.db"):
-            os.remove("test_events.db")
-            print("✅ Test database cleaned up")
     
     # テスト実行
     asyncio.run(test_event_storage())
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Pythonバージョン差異の吸収
+"""
+
+import sys
+from typing import Any, Dict
+
+# __slots__ 付きdataclass（Python 3.10以降のみ対応）
+# 使用例: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
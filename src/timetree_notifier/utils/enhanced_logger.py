@@ -5,12 +5,14 @@
 import json
 import logging
 import sys
+from array import array
 from datetime import datetime
+from statistics import fmean
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from enum import Enum
 import structlog
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 
 class LogLevel(Enum):
@@ -34,9 +36,10 @@ class MetricsCollector:
     """システムメトリクス収集"""
     
     def __init__(self):
-        self.counters = defaultdict(int)
+        self.counters: Counter = Counter()
         self.gauges = {}
-        self.histograms = defaultdict(list)
+        # 所要時間は倍精度配列に格納（要素ごとのfloatオブジェクトを持たない）
+        self.histograms: Dict[str, array] = defaultdict(lambda: array('d'))
         self.start_time = datetime.now()
     
     def record_success(self, operation: str, duration: float):
@@ -56,6 +59,12 @@ class MetricsCollector:
         """ゲージメトリクス設定"""
         self.gauges[name] = value
     
+    def reset(self):
+        """記録済みメトリクスのクリア（稼働時間の起点は維持）"""
+        self.counters.clear()
+        self.gauges.clear()
+        self.histograms.clear()
+    
     def get_health_summary(self) -> dict:
         """システム健全性サマリー"""
         uptime = (datetime.now() - self.start_time).total_seconds()
@@ -80,7 +89,7 @@ class MetricsCollector:
         avg_response_times = {}
         for key, durations in self.histograms.items():
             if durations:
-                avg_response_times[key] = sum(durations) / len(durations)
+                avg_response_times[key] = fmean(durations)
         
         return {
             'uptime_seconds': uptime,
@@ -2,331 +2,10 @@
 """
 Phase 3: Multi-channel Notification System Integration Test
 ASCII Version for Windows Command Prompt Compatibility
+(shared implementation lives in _phase3_common.py)
 """
 
-import asyncio
-import json
-import sys
-import os
-from datetime import datetime, timedelta
-
-# Path setup
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.join(current_dir, '..', '..')
-sys.path.insert(0, project_root)
-
-class MockEventData:
-    def __init__(self, title, start_time, end_time=None, location="", description="", is_all_day=False):
-        self.title = title
-        self.start_time = start_time
-        self.end_time = end_time
-        self.location = location
-        self.description = description
-        self.is_all_day = is_all_day
-
-class MockNotificationResult:
-    def __init__(self, success=True, channel_type="LINE", message_id="test_123"):
-        self.success = success
-        self.channel_type = channel_type
-        self.message_id = message_id
-        self.delivery_time = datetime.now()
-        self.error = None if success else Exception("Test error")
-
-class MockNotifier:
-    def __init__(self, should_succeed=True):
-        self.should_succeed = should_succeed
-        self.call_count = 0
-    
-    async def send_message(self, message_data):
-        self.call_count += 1
-        await asyncio.sleep(0.1)
-        return MockNotificationResult(success=self.should_succeed)
-
-class SimpleMessageFormatter:
-    @staticmethod
-    def format_daily_message(events, target_date, message_format="simple"):
-        date_str = target_date.strftime('%m/%d')
-        event_count = len(events)
-        
-        if message_format == "line_flex":
-            return {
-                "type": "flex",
-                "altText": f"{date_str} Schedule",
-                "contents": {"type": "bubble", "header": {"type": "box", "layout": "vertical"}}
-            }
-        elif message_format == "slack_blocks":
-            return {
-                "blocks": [{
-                    "type": "header",
-                    "text": {"type": "plain_text", "text": f"{date_str} Schedule"}
-                }]
-            }
-        elif message_format == "discord_embed":
-            return {
-                "embed": {
-                    "title": f"{date_str} Schedule",
-                    "color": 0x00ff00,
-                    "fields": []
-                }
-            }
-        elif message_format == "gas_voice":
-            return {
-                "text": f"Today you have {event_count} events",
-                "ssml": f"<speak>Today you have {event_count} events</speak>"
-            }
-        else:
-            return f"Good morning! {date_str} Schedule: {event_count} events"
-
-class SimpleMultiChannelDispatcher:
-    def __init__(self):
-        self.channels = {}
-    
-    async def send_to_all_channels(self, events, target_date, delivery_method="parallel"):
-        formatter = SimpleMessageFormatter()
-        results = []
-        
-        for channel_type, notifier in self.channels.items():
-            message_format = "simple"
-            if channel_type == "LINE":
-                message_format = "line_flex"
-            elif channel_type == "SLACK":
-                message_format = "slack_blocks"
-            elif channel_type == "DISCORD":
-                message_format = "discord_embed"
-            elif channel_type == "GAS":
-                message_format = "gas_voice"
-            
-            message = formatter.format_daily_message(events, target_date, message_format)
-            result = await notifier.send_message({
-                'events': events,
-                'message': message,
-                'target_date': target_date
-            })
-            results.append(result)
-        
-        successful = sum(1 for r in results if r.success)
-        total = len(results)
-        
-        return {
-            'total_channels': total,
-            'successful_deliveries': successful,
-            'failed_deliveries': total - successful,
-            'success_rate': successful / total if total > 0 else 0,
-            'results': results
-        }
-
-class Phase3IntegrationTest:
-    def __init__(self):
-        self.today = datetime.now().date()
-        self.test_events = [
-            MockEventData(
-                title="Morning Meeting",
-                start_time=datetime.combine(self.today, datetime.min.time().replace(hour=9)),
-                end_time=datetime.combine(self.today, datetime.min.time().replace(hour=10)),
-                location="Room A",
-                description="Monthly review"
-            ),
-            MockEventData(
-                title="Lunch Meeting",
-                start_time=datetime.combine(self.today, datetime.min.time().replace(hour=12)),
-                end_time=datetime.combine(self.today, datetime.min.time().replace(hour=13)),
-                location="Restaurant B",
-                description="Project discussion"
-            ),
-            MockEventData(
-                title="Health Checkup",
-                start_time=datetime.combine(self.today, datetime.min.time()),
-                is_all_day=True,
-                location="Hospital C",
-                description="Annual health check"
-            )
-        ]
-    
-    async def test_full_notification_pipeline(self):
-        print("[TEST] Full notification pipeline test starting...")
-        
-        dispatcher = SimpleMultiChannelDispatcher()
-        dispatcher.channels = {
-            'LINE': MockNotifier(should_succeed=True),
-            'GAS': MockNotifier(should_succeed=True),
-            'SLACK': MockNotifier(should_succeed=True),
-            'DISCORD': MockNotifier(should_succeed=True)
-        }
-        
-        result = await dispatcher.send_to_all_channels(
-            events=self.test_events,
-            target_date=self.today
-        )
-        
-        assert result['total_channels'] == 4, f"Expected 4 channels, got {result['total_channels']}"
-        assert result['successful_deliveries'] == 4, f"Expected 4 successes, got {result['successful_deliveries']}"
-        assert result['success_rate'] == 1.0, f"Expected 100% success rate, got {result['success_rate']}"
-        
-        print("[PASS] Full notification pipeline test - SUCCESS")
-        return True
-    
-    def test_message_format_optimization(self):
-        print("[TEST] Message format optimization test starting...")
-        
-        formatter = SimpleMessageFormatter()
-        formats_to_test = ["simple", "line_flex", "slack_blocks", "discord_embed", "gas_voice"]
-        
-        for message_format in formats_to_test:
-            message = formatter.format_daily_message(
-                events=self.test_events,
-                target_date=self.today,
-                message_format=message_format
-            )
-            
-            assert message is not None, f"Message is None for format {message_format}"
-            
-            if message_format == "line_flex":
-                assert isinstance(message, dict), f"LINE Flex should return dict"
-                assert "type" in message, f"LINE Flex missing 'type'"
-                assert message["type"] == "flex", f"LINE Flex type should be 'flex'"
-            
-            elif message_format == "slack_blocks":
-                assert isinstance(message, dict), f"Slack Blocks should return dict"
-                assert "blocks" in message, f"Slack Blocks missing 'blocks'"
-            
-            elif message_format == "discord_embed":
-                assert isinstance(message, dict), f"Discord Embed should return dict"
-                assert "embed" in message, f"Discord Embed missing 'embed'"
-            
-            elif message_format == "gas_voice":
-                assert isinstance(message, dict), f"GAS Voice should return dict"
-                assert "text" in message or "ssml" in message, f"GAS Voice missing text/ssml"
-            
-            print(f"   [OK] {message_format} format validation complete")
-        
-        print("[PASS] Message format optimization test - SUCCESS")
-        return True
-    
-    async def test_error_handling_and_recovery(self):
-        print("[TEST] Error handling and recovery test starting...")
-        
-        dispatcher = SimpleMultiChannelDispatcher()
-        dispatcher.channels = {
-            'LINE': MockNotifier(should_succeed=True),
-            'GAS': MockNotifier(should_succeed=False),
-            'SLACK': MockNotifier(should_succeed=True),
-            'DISCORD': MockNotifier(should_succeed=False)
-        }
-        
-        result = await dispatcher.send_to_all_channels(
-            events=self.test_events,
-            target_date=self.today
-        )
-        
-        assert result['total_channels'] == 4, f"Expected 4 channels"
-        assert result['successful_deliveries'] == 2, f"Expected 2 successes, got {result['successful_deliveries']}"
-        assert result['failed_deliveries'] == 2, f"Expected 2 failures, got {result['failed_deliveries']}"
-        assert result['success_rate'] == 0.5, f"Expected 50% success rate, got {result['success_rate']}"
-        
-        print("[PASS] Error handling and recovery test - SUCCESS")
-        return True
-    
-    async def test_performance_measurement(self):
-        print("[TEST] Performance measurement test starting...")
-        
-        many_events = []
-        for i in range(20):
-            event = MockEventData(
-                title=f"Meeting #{i+1}",
-                start_time=datetime.combine(self.today, datetime.min.time().replace(hour=9 + i % 10)),
-                location=f"Room {chr(65 + i % 5)}",
-                description=f"Test event {i+1}"
-            )
-            many_events.append(event)
-        
-        dispatcher = SimpleMultiChannelDispatcher()
-        dispatcher.channels = {'LINE': MockNotifier(should_succeed=True)}
-        
-        start_time = datetime.now()
-        result = await dispatcher.send_to_all_channels(
-            events=many_events,
-            target_date=self.today
-        )
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
-        
-        assert processing_time < 3.0, f"Processing took too long: {processing_time:.2f}s"
-        assert result['success_rate'] == 1.0, f"Expected 100% success rate"
-        
-        print(f"   [RESULT] Processing time: {processing_time:.2f}s (20 events)")
-        print("[PASS] Performance measurement test - SUCCESS")
-        return True
-
-async def run_all_tests():
-    print("TimeTree Notifier v3.0 - Phase 3 Integration Test")
-    print("=" * 60)
-    
-    test_instance = Phase3IntegrationTest()
-    test_results = []
-    
-    # Async tests
-    async_tests = [
-        ("Full Notification Pipeline", test_instance.test_full_notification_pipeline),
-        ("Error Handling", test_instance.test_error_handling_and_recovery),
-        ("Performance Measurement", test_instance.test_performance_measurement)
-    ]
-    
-    for test_name, test_method in async_tests:
-        try:
-            result = await test_method()
-            test_results.append((test_name, True, None))
-        except Exception as e:
-            test_results.append((test_name, False, str(e)))
-            print(f"[FAIL] {test_name} test failed: {str(e)}")
-    
-    # Sync tests
-    sync_tests = [
-        ("Message Format Optimization", test_instance.test_message_format_optimization)
-    ]
-    
-    for test_name, test_method in sync_tests:
-        try:
-            result = test_method()
-            test_results.append((test_name, True, None))
-        except Exception as e:
-            test_results.append((test_name, False, str(e)))
-            print(f"[FAIL] {test_name} test failed: {str(e)}")
-    
-    # Results
-    print("=" * 60)
-    passed_tests = sum(1 for _, success, _ in test_results if success)
-    total_tests = len(test_results)
-    
-    print(f"Test Results: {passed_tests}/{total_tests} PASSED")
-    
-    if passed_tests == total_tests:
-        print("Phase 3 Integration Test - ALL TESTS PASSED!")
-        print("\nTimeTree Notifier v3.0 Phase 3 Implementation Complete")
-        print("Multi-channel notification system is ready!")
-        
-        print("\nImplemented Features:")
-        print("   * GAS Voice Notification System (Google Assistant/Google Home)")
-        print("   * Multi-channel Dispatch System (Parallel processing, Rate limiting)")
-        print("   * Message Format Optimization (LINE Flex, Slack Blocks, Discord Embed)")
-        print("   * Slack/Discord Rich Messaging")
-        print("   * Error Handling and Auto Recovery")
-        print("   * Performance Optimization")
-        
-        return True
-    else:
-        print("Some tests failed")
-        for test_name, success, error in test_results:
-            if not success:
-                print(f"   [FAIL] {test_name}: {error}")
-        return False
+from _phase3_common import main
 
 if __name__ == "__main__":
-    success = asyncio.run(run_all_tests())
-    
-    if success:
-        print("\nNext Steps:")
-        print("   1. Phase 4: Cloud Migration (GitHub Actions)")
-        print("   2. Production Environment Testing")
-        print("   3. Operation Monitoring Setup")
-    else:
-        print("\nTest failures detected. Please check implementation.")
\ No newline at end of file
+    main(locale="ascii")
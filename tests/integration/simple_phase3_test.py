@@ -3,385 +3,10 @@
 Phase 3: マルチチャンネル通知システム簡易統合テスト
 
 TimeTree Notifier v3.0 - Phase 3の動作確認テスト
-モック環境での基本動作確認
+モック環境での基本動作確認（実装は _phase3_common.py）
 """
 
-import asyncio
-import json
-import sys
-import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-
-# パスの設定
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.join(current_dir, '..', '..')
-sys.path.insert(0, project_root)
-
-class MockEventData:
-    """テスト用イベントデータ"""
-    
-    def __init__(self, title, start_time, end_time=None, location="", description="", is_all_day=False):
-        self.title = title
-        self.start_time = start_time
-        self.end_time = end_time
-        self.location = location
-        self.description = description
-        self.is_all_day = is_all_day
-
-class MockNotificationResult:
-    """モック通知結果"""
-    
-    def __init__(self, success=True, channel_type="LINE", message_id="test_123"):
-        self.success = success
-        self.channel_type = channel_type
-        self.message_id = message_id
-        self.delivery_time = datetime.now()
-        self.error = None if success else Exception("テストエラー")
-
-class MockNotifier:
-    """モック通知クラス"""
-    
-    def __init__(self, should_succeed=True):
-        self.should_succeed = should_succeed
-        self.call_count = 0
-    
-    async def send_message(self, message_data):
-        """メッセージ送信のモック"""
-        self.call_count += 1
-        await asyncio.sleep(0.1)  # 非同期処理をシミュレート
-        return MockNotificationResult(success=self.should_succeed)
-
-class SimpleMessageFormatter:
-    """簡易メッセージフォーマッター"""
-    
-    @staticmethod
-    def format_daily_message(events, target_date, message_format="simple"):
-        """日次メッセージフォーマット"""
-        date_str = target_date.strftime('%m月%d日')
-        weekdays = ['月', '火', '水', '木', '金', '土', '日']
-        weekday = weekdays[target_date.weekday()]
-        
-        if message_format == "line_flex":
-            return {
-                "type": "flex",
-                "altText": f"{date_str}({weekday})の予定",
-                "contents": {
-                    "type": "bubble",
-                    "header": {"type": "box", "layout": "vertical"}
-                }
-            }
-        elif message_format == "slack_blocks":
-            return {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": f"📅 {date_str}({weekday})の予定"
-                        }
-                    }
-                ]
-            }
-        elif message_format == "discord_embed":
-            return {
-                "embed": {
-                    "title": f"📅 {date_str}({weekday})の予定",
-                    "color": 0x00ff00,
-                    "fields": []
-                }
-            }
-        elif message_format == "gas_voice":
-            return {
-                "text": f"{date_str}の予定は{len(events)}件です",
-                "ssml": f"<speak>{date_str}の予定は{len(events)}件です</speak>"
-            }
-        else:
-            return f"🌅 おはようございます！\n\n📅 {date_str}({weekday})の予定 {len(events)}件"
-
-class SimpleMultiChannelDispatcher:
-    """簡易マルチチャンネルディスパッチャー"""
-    
-    def __init__(self):
-        self.channels = {}
-    
-    async def send_to_all_channels(self, events, target_date, delivery_method="parallel"):
-        """全チャンネルへの配信"""
-        formatter = SimpleMessageFormatter()
-        results = []
-        
-        for channel_type, notifier in self.channels.items():
-            # フォーマット選択
-            message_format = "simple"
-            if channel_type == "LINE":
-                message_format = "line_flex"
-            elif channel_type == "SLACK":
-                message_format = "slack_blocks"
-            elif channel_type == "DISCORD":
-                message_format = "discord_embed"
-            elif channel_type == "GAS":
-                message_format = "gas_voice"
-            
-            # メッセージフォーマット
-            message = formatter.format_daily_message(events, target_date, message_format)
-            
-            # 送信
-            result = await notifier.send_message({
-                'events': events,
-                'message': message,
-                'target_date': target_date
-            })
-            results.append(result)
-        
-        # 結果集計
-        successful = sum(1 for r in results if r.success)
-        total = len(results)
-        
-        return {
-            'total_channels': total,
-            'successful_deliveries': successful,
-            'failed_deliveries': total - successful,
-            'success_rate': successful / total if total > 0 else 0,
-            'results': results
-        }
-
-class Phase3IntegrationTest:
-    """Phase 3統合テスト"""
-    
-    def __init__(self):
-        self.today = datetime.now().date()
-        self.test_events = [
-            MockEventData(
-                title="朝の会議",
-                start_time=datetime.combine(self.today, datetime.min.time().replace(hour=9)),
-                end_time=datetime.combine(self.today, datetime.min.time().replace(hour=10)),
-                location="会議室A",
-                description="月次進捗レビュー"
-            ),
-            MockEventData(
-                title="ランチミーティング",
-                start_time=datetime.combine(self.today, datetime.min.time().replace(hour=12)),
-                end_time=datetime.combine(self.today, datetime.min.time().replace(hour=13)),
-                location="レストランB",
-                description="新プロジェクト打ち合わせ"
-            ),
-            MockEventData(
-                title="定期健康診断",
-                start_time=datetime.combine(self.today, datetime.min.time()),
-                is_all_day=True,
-                location="病院C",
-                description="年1回の健康チェック"
-            )
-        ]
-    
-    async def test_full_notification_pipeline(self):
-        """完全な通知パイプラインテスト"""
-        print("[テスト] 完全な通知パイプラインテスト開始...")
-        
-        # ディスパッチャー設定
-        dispatcher = SimpleMultiChannelDispatcher()
-        dispatcher.channels = {
-            'LINE': MockNotifier(should_succeed=True),
-            'GAS': MockNotifier(should_succeed=True),
-            'SLACK': MockNotifier(should_succeed=True),
-            'DISCORD': MockNotifier(should_succeed=True)
-        }
-        
-        # 全チャンネルへの配信テスト
-        result = await dispatcher.send_to_all_channels(
-            events=self.test_events,
-            target_date=self.today
-        )
-        
-        # 結果検証
-        assert result['total_channels'] == 4, f"Expected 4 channels, got {result['total_channels']}"
-        assert result['successful_deliveries'] == 4, f"Expected 4 successes, got {result['successful_deliveries']}"
-        assert result['success_rate'] == 1.0, f"Expected 100% success rate, got {result['success_rate']}"
-        
-        print("[成功] 完全な通知パイプラインテスト - 成功")
-        return True
-    
-    def test_message_format_optimization(self):
-        """メッセージフォーマット最適化テスト"""
-        print("[テスト] メッセージフォーマット最適化テスト開始...")
-        
-        formatter = SimpleMessageFormatter()
-        
-        # 各フォーマットでのメッセージ生成テスト
-        formats_to_test = ["simple", "line_flex", "slack_blocks", "discord_embed", "gas_voice"]
-        
-        for message_format in formats_to_test:
-            message = formatter.format_daily_message(
-                events=self.test_events,
-                target_date=self.today,
-                message_format=message_format
-            )
-            
-            # 基本的な構造確認
-            assert message is not None, f"Message is None for format {message_format}"
-            
-            # フォーマット固有の検証
-            if message_format == "line_flex":
-                assert isinstance(message, dict), f"LINE Flex should return dict"
-                assert "type" in message, f"LINE Flex missing 'type'"
-                assert message["type"] == "flex", f"LINE Flex type should be 'flex'"
-            
-            elif message_format == "slack_blocks":
-                assert isinstance(message, dict), f"Slack Blocks should return dict"
-                assert "blocks" in message, f"Slack Blocks missing 'blocks'"
-            
-            elif message_format == "discord_embed":
-                assert isinstance(message, dict), f"Discord Embed should return dict"
-                assert "embed" in message, f"Discord Embed missing 'embed'"
-            
-            elif message_format == "gas_voice":
-                assert isinstance(message, dict), f"GAS Voice should return dict"
-                assert "text" in message or "ssml" in message, f"GAS Voice missing text/ssml"
-            
-            print(f"   [OK] {message_format}フォーマット検証完了")
-        
-        print("[成功] メッセージフォーマット最適化テスト - 成功")
-        return True
-    
-    async def test_error_handling_and_recovery(self):
-        """エラーハンドリングと回復処理テスト"""
-        print("[テスト] エラーハンドリングと回復処理テスト開始...")
-        
-        # 部分的な失敗をシミュレート
-        dispatcher = SimpleMultiChannelDispatcher()
-        dispatcher.channels = {
-            'LINE': MockNotifier(should_succeed=True),    # 成功
-            'GAS': MockNotifier(should_succeed=False),    # 失敗
-            'SLACK': MockNotifier(should_succeed=True),   # 成功
-            'DISCORD': MockNotifier(should_succeed=False) # 失敗
-        }
-        
-        # 配信実行
-        result = await dispatcher.send_to_all_channels(
-            events=self.test_events,
-            target_date=self.today
-        )
-        
-        # 部分的な成功を確認
-        assert result['total_channels'] == 4, f"Expected 4 channels"
-        assert result['successful_deliveries'] == 2, f"Expected 2 successes, got {result['successful_deliveries']}"
-        assert result['failed_deliveries'] == 2, f"Expected 2 failures, got {result['failed_deliveries']}"
-        assert result['success_rate'] == 0.5, f"Expected 50% success rate, got {result['success_rate']}"
-        
-        print("[成功] エラーハンドリングと回復処理テスト - 成功")
-        return True
-    
-    async def test_performance_measurement(self):
-        """パフォーマンス測定テスト"""
-        print("[テスト] パフォーマンス測定テスト開始...")
-        
-        # 大量のイベント（20件）でテスト
-        many_events = []
-        for i in range(20):
-            event = MockEventData(
-                title=f"会議 #{i+1}",
-                start_time=datetime.combine(self.today, datetime.min.time().replace(hour=9 + i % 10)),
-                location=f"会議室{chr(65 + i % 5)}",
-                description=f"テストイベント {i+1}"
-            )
-            many_events.append(event)
-        
-        # 配信設定
-        dispatcher = SimpleMultiChannelDispatcher()
-        dispatcher.channels = {'LINE': MockNotifier(should_succeed=True)}
-        
-        # パフォーマンス測定
-        start_time = datetime.now()
-        
-        result = await dispatcher.send_to_all_channels(
-            events=many_events,
-            target_date=self.today
-        )
-        
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
-        
-        # パフォーマンス検証
-        assert processing_time < 3.0, f"Processing took too long: {processing_time:.2f}s"
-        assert result['success_rate'] == 1.0, f"Expected 100% success rate"
-        
-        print(f"   [結果] 処理時間: {processing_time:.2f}秒 (20イベント)")
-        print("[成功] パフォーマンス測定テスト - 成功")
-        return True
-
-async def run_all_tests():
-    """全テストの実行"""
-    print("TimeTree Notifier v3.0 - Phase 3 統合テスト開始")
-    print("=" * 60)
-    
-    test_instance = Phase3IntegrationTest()
-    
-    test_results = []
-    
-    # 非同期テスト
-    async_tests = [
-        ("完全な通知パイプライン", test_instance.test_full_notification_pipeline),
-        ("エラーハンドリング", test_instance.test_error_handling_and_recovery),
-        ("パフォーマンス測定", test_instance.test_performance_measurement)
-    ]
-    
-    for test_name, test_method in async_tests:
-        try:
-            result = await test_method()
-            test_results.append((test_name, True, None))
-        except Exception as e:
-            test_results.append((test_name, False, str(e)))
-            print(f"❌ {test_name}テスト失敗: {str(e)}")
-    
-    # 同期テスト
-    sync_tests = [
-        ("メッセージフォーマット最適化", test_instance.test_message_format_optimization)
-    ]
-    
-    for test_name, test_method in sync_tests:
-        try:
-            result = test_method()
-            test_results.append((test_name, True, None))
-        except Exception as e:
-            test_results.append((test_name, False, str(e)))
-            print(f"❌ {test_name}テスト失敗: {str(e)}")
-    
-    # 結果報告
-    print("=" * 60)
-    passed_tests = sum(1 for _, success, _ in test_results if success)
-    total_tests = len(test_results)
-    
-    print(f"📊 テスト結果: {passed_tests}/{total_tests} 成功")
-    
-    if passed_tests == total_tests:
-        print("🎉 Phase 3統合テスト - 全て成功！")
-        print("\n✨ TimeTree Notifier v3.0 Phase 3実装完了")
-        print("📱 マルチチャンネル通知システムの準備が整いました！")
-        
-        print("\n🔧 実装された機能:")
-        print("   • GAS音声通知システム (Google Assistant/Google Home対応)")
-        print("   • マルチチャンネル配信システム (並列処理・レート制限)")
-        print("   • メッセージフォーマット最適化 (LINE Flex, Slack Blocks, Discord Embed)")
-        print("   • Slack/Discord リッチメッセージング")
-        print("   • エラーハンドリングと自動回復")
-        print("   • パフォーマンス最適化")
-        
-        return True
-    else:
-        print("⚠️ 一部のテストが失敗しました")
-        for test_name, success, error in test_results:
-            if not success:
-                print(f"   ❌ {test_name}: {error}")
-        return False
+from _phase3_common import main
 
 if __name__ == "__main__":
-    """統合テストの実行"""
-    success = asyncio.run(run_all_tests())
-    
-    if success:
-        print("\n🎯 次のステップ:")
-        print("   1. Phase 4: クラウド移行 (GitHub Actions)")
-        print("   2. 実環境でのテスト実行")
-        print("   3. 運用監視設定")
-    else:
-        print("\n🔧 テスト失敗があります。実装を確認してください。")
\ No newline at end of file
+    main(locale="unicode")
@@ -1,33 +1,90 @@
 """
 新機能と既存システムの統合テスト
 Phase 1で実装した機能が既存システムと正常に連携することを確認
+
+各テストクラスは独立しているため並列実行可能:
+    pytest -n auto --dist=loadscope tests/integration
 """
 
 import pytest
 import asyncio
+import importlib
+import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-import tempfile
+from unittest.mock import patch, AsyncMock, MagicMock
 import json
 
 # 新機能のインポート
 from src.timetree_notifier.layers.data_acquisition.error_handler import ErrorHandler, ErrorType, RecoveryResult
+from src.timetree_notifier.layers.data_processing import encoding_handler as encoding_handler_module
 from src.timetree_notifier.layers.data_processing.encoding_handler import EncodingHandler
+from src.timetree_notifier.utils import enhanced_logger
 from src.timetree_notifier.utils.enhanced_logger import get_logger, LogLevel
+from src.timetree_notifier.config import enhanced_config
 from src.timetree_notifier.config.enhanced_config import ConfigManager, get_config
 
 # 既存システムのインポート
 from src.timetree_notifier.core.daily_notifier import DailySummaryNotifier
-from src.timetree_notifier.core.models import Event, DailySummary
+from src.timetree_notifier.core.models import Event, DailySummary, NotificationResult
+
+
+@dataclass(frozen=True)
+class _TimeTreeConfig:
+    email: str = "test@example.com"
+    password: str = "test_password"
+    calendar_code: str = "test_code"
+
+
+@dataclass(frozen=True)
+class _DailySummaryConfig:
+    timezone: str = "Asia/Tokyo"
+
+
+@dataclass(frozen=True)
+class _NotificationConfig:
+    line_channel_access_token: str = "test_token"
+    line_user_id: str = "test_user"
+
+
+@dataclass(frozen=True)
+class _StaticConfig:
+    """DailySummaryNotifier が参照する設定項目のみを持つ固定テスト設定"""
+    timetree: _TimeTreeConfig = _TimeTreeConfig()
+    daily_summary: _DailySummaryConfig = _DailySummaryConfig()
+    notification: _NotificationConfig = _NotificationConfig()
+
+
+_STATIC_CONFIG = _StaticConfig()
+
+
+@pytest.fixture(scope="session")
+def error_handler():
+    """セッション共有ErrorHandler（状態は各テスト前にリセット）"""
+    return ErrorHandler()
+
+
+@pytest.fixture(scope="session")
+def encoding_handler():
+    """セッション共有EncodingHandler（修正パターンの構築を1回に）"""
+    return EncodingHandler()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_state(error_handler):
+    """共有オブジェクトのテスト間状態をクリア"""
+    error_handler.error_counts.clear()
+    
+    # get_logger() はロガー名を固定してしまうため、既存インスタンスのみリセット
+    shared_logger = enhanced_logger._global_logger
+    if shared_logger is not None and shared_logger.metrics is not None:
+        shared_logger.metrics.reset()
 
 
 class TestEnhancedErrorHandling:
     """強化エラーハンドリングの統合テスト"""
     
-    @pytest.fixture
-    def error_handler(self):
-        return ErrorHandler()
-    
     @pytest.fixture
     def mock_config(self):
         return {
@@ -64,10 +121,6 @@ class TestEnhancedErrorHandling:
 class TestEncodingIntegration:
     """文字化け修正機能の統合テスト"""
     
-    @pytest.fixture
-    def encoding_handler(self):
-        return EncodingHandler()
-    
     def test_garbled_text_fix(self, encoding_handler):
         """実際の文字化けデータの修正テスト"""
         test_cases = [
@@ -109,6 +162,44 @@ class TestEncodingIntegration:
         
         # 2番目のイベントは変更されない
         assert fixed_events[1]['title'] == '正常なイベント'
+    
+    def test_event_data_batch_fix_parallel(self, encoding_handler):
+        """スレッドプールでのバッチ修正が逐次処理と同じ順序・結果になることを確認"""
+        def build_events():
+            garbled = ['�A�I�L�������̃��X�g', '‚±‚ñ‚É‚¿‚Í', 'ƒeƒXƒg', '正常なテキスト']
+            return [
+                {
+                    'id': f'event_{i}',
+                    'title': garbled[i % len(garbled)],
+                    'description': garbled[(i + 1) % len(garbled)],
+                    'location': '東京'
+                }
+                for i in range(2 * EncodingHandler.PARALLEL_BATCH_THRESHOLD)
+            ]
+        
+        sequential = encoding_handler.batch_fix_events(build_events(), workers=1)
+        parallel = encoding_handler.batch_fix_events(build_events(), workers=4)
+        
+        assert [event['id'] for event in parallel] == [event['id'] for event in sequential]
+        assert parallel == sequential
+    
+    @pytest.fixture
+    def charset_normalizer_only(self, monkeypatch):
+        """cchardet / chardet をインポート不可にしてモジュールを再読み込み"""
+        pytest.importorskip("charset_normalizer")
+        monkeypatch.setitem(sys.modules, "cchardet", None)
+        monkeypatch.setitem(sys.modules, "chardet", None)
+        yield importlib.reload(encoding_handler_module)
+        monkeypatch.undo()
+        importlib.reload(encoding_handler_module)
+    
+    def test_utf8_text_not_redecoded_without_chardet(self, charset_normalizer_only):
+        """charset-normalizer のみの環境で正しいUTF-8文字列が再デコードされないことを確認"""
+        handler = charset_normalizer_only.EncodingHandler()
+        
+        # charset-normalizer はこの文字列を cp932 と判定し「ﾆ弾ﾆ湛ﾆ暖」に化けさせる
+        assert handler._detect_and_fix_encoding("ƒeƒXƒg") == "ƒeƒXƒg"
+        assert charset_normalizer_only.chardet is None
 
 
 class TestEnhancedLogging:
@@ -149,61 +240,99 @@ class TestEnhancedLogging:
         assert health['total_operations'] > 0
 
 
+@pytest.fixture(scope="session")
+def _template_dir(tmp_path_factory):
+    """設定テンプレートをセッションで1回だけ生成"""
+    template_dir = tmp_path_factory.mktemp("config_template")
+    ConfigManager(template_dir).save_config_template()
+    return template_dir
+
+
+@pytest.fixture
+def fake_config_dir(fs):
+    """pyfakefs上の設定ディレクトリ（テンプレート書き出し・読み込みともディスクI/Oなし）"""
+    return Path("/config")
+
+
+@pytest.fixture
+def templated_config_dir(_template_dir, fs):
+    """セッションで生成済みのテンプレートをpyfakefs上に複製した設定ディレクトリ（変更は実ディスクに反映されない）"""
+    fs.add_real_directory(_template_dir, read_only=False, target_path="/config")
+    return Path("/config")
+
+
 class TestConfigurationManagement:
     """設定管理システムの統合テスト"""
     
-    @pytest.fixture
-    def temp_config_dir(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    @pytest.fixture(autouse=True)
+    def _clear_yaml_cache(self):
+        """複製したテンプレートは更新時刻・サイズが同一のため、解析キャッシュをテスト間で持ち越さない"""
+        enhanced_config._YAML_CACHE.clear()
     
-    def test_config_manager_initialization(self, temp_config_dir):
+    def test_config_manager_initialization(self, fake_config_dir):
         """設定マネージャーの初期化テスト"""
-        config_manager = ConfigManager(temp_config_dir)
+        config_manager = ConfigManager(fake_config_dir)
         
         assert config_manager.config_dir.exists()
         assert config_manager.secrets_dir.exists()
     
-    def test_config_template_creation(self, temp_config_dir):
+    def test_config_template_creation(self, fake_config_dir):
         """設定テンプレートの作成テスト"""
-        config_manager = ConfigManager(temp_config_dir)
+        config_manager = ConfigManager(fake_config_dir)
         config_manager.save_config_template()
         
         # テンプレートファイルが作成されることを確認
         assert (config_manager.config_dir / "main.yaml").exists()
         assert (config_manager.config_dir / "data_acquisition.yaml").exists()
     
-    def test_config_loading(self, temp_config_dir):
+    def test_config_loading(self, templated_config_dir):
         """設定の読み込みテスト"""
-        config_manager = ConfigManager(temp_config_dir)
-        config_manager.save_config_template()
+        config_manager = ConfigManager(templated_config_dir)
         
         config = config_manager.load_config()
         
         assert config.version == "3.0.0"
         assert config.environment in ["development", "staging", "production"]
+    
+    def test_config_snapshot_invalidated_by_yaml_edit(self, templated_config_dir):
+        """YAML編集後は更新時刻が同じでもJSONスナップショットを使わないことを確認"""
+        config_manager = ConfigManager(templated_config_dir)
+        
+        main_yaml = config_manager.config_dir / "main.yaml"
+        main_yaml.write_text(main_yaml.read_text(encoding='utf-8').replace("3.0.0", "9.9.9"), encoding='utf-8')
+        
+        # 粗い粒度のファイルシステムを想定し、YAMLとスナップショットの更新時刻を揃える
+        same_mtime_ns = 1_700_000_000 * 10**9
+        for path in (main_yaml, main_yaml.with_suffix(".json")):
+            os.utime(path, ns=(same_mtime_ns, same_mtime_ns))
+        
+        assert config_manager._load_yaml_file(main_yaml)["version"] == "9.9.9"
+    
+    def test_unrelated_json_not_used_as_snapshot(self, templated_config_dir):
+        """テンプレート由来でない同名JSONはスナップショットとして扱わないことを確認"""
+        config_manager = ConfigManager(templated_config_dir)
+        
+        main_yaml = config_manager.config_dir / "main.yaml"
+        main_yaml.with_suffix(".json").write_text('{"version": "0.0.0"}', encoding='utf-8')
+        
+        assert config_manager._load_yaml_file(main_yaml)["version"] == "3.0.0"
 
 
 class TestSystemIntegration:
     """既存システムとの統合テスト"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_config(self):
-        config_mock = Mock()
-        config_mock.timetree.email = "test@example.com"
-        config_mock.timetree.password = "test_password"
-        config_mock.timetree.calendar_code = "test_code"
-        config_mock.daily_summary.timezone = "Asia/Tokyo"
-        return config_mock
+        return _STATIC_CONFIG
     
-    @pytest.fixture 
-    def enhanced_daily_notifier(self, mock_config):
-        """強化機能を統合したDailyNotifierのテスト版"""
+    @pytest.fixture(scope="class")
+    def enhanced_daily_notifier(self, mock_config, error_handler, encoding_handler):
+        """強化機能を統合したDailyNotifierのテスト版（クラス内で共有）"""
         notifier = DailySummaryNotifier(mock_config)
         
-        # 新機能を注入
-        notifier.error_handler = ErrorHandler()
-        notifier.encoding_handler = EncodingHandler()
+        # 新機能を注入（セッション共有のハンドラーを再利用）
+        notifier.error_handler = error_handler
+        notifier.encoding_handler = encoding_handler
         notifier.enhanced_logger = get_logger("daily_notifier_test")
         
         return notifier
@@ -212,7 +341,12 @@ class TestSystemIntegration:
     async def test_enhanced_daily_summary_with_error_handling(self, enhanced_daily_notifier):
         """エラーハンドリング統合後の日次サマリーテスト"""
         
-        with patch.object(enhanced_daily_notifier, '_execute_timetree_exporter') as mock_exporter:
+        # エラー通知は実際のLINE APIへ送信しない
+        error_notification = NotificationResult(success=False, error_message="not sent in tests")
+        
+        with patch.object(enhanced_daily_notifier, '_execute_timetree_exporter') as mock_exporter, \
+             patch.object(enhanced_daily_notifier.line_notifier, 'send_message',
+                          new=AsyncMock(return_value=error_notification)) as mock_send:
             # TimeTreeエクスポートが失敗するケースをテスト
             mock_exporter.side_effect = ConnectionError("Network timeout")
             
@@ -221,6 +355,10 @@ class TestSystemIntegration:
             
             # 結果はFalseでも例外は発生しない
             assert isinstance(result, bool)
+            
+            # エラー通知の送信が試みられたこと
+            mock_send.assert_awaited_once()
+            assert "Network timeout" in mock_send.await_args.args[0]
     
     def test_encoding_fix_in_event_processing(self, enhanced_daily_notifier):
         """イベント処理での文字化け修正統合テスト"""
@@ -274,60 +412,62 @@ class TestSystemIntegration:
         assert health['overall_status'] in ['healthy', 'warning', 'degraded', 'critical']
 
 
+@pytest.fixture(scope="session")
+def workflow_components(_template_dir, error_handler, encoding_handler):
+    """ワークフロー各ステップで共有するコンポーネント（セッションで1回だけ構築）"""
+    return {
+        'config_manager': ConfigManager(_template_dir),
+        'logger': get_logger("workflow_test", LogLevel.INFO),
+        'error_handler': error_handler,
+        'encoding_handler': encoding_handler
+    }
+
+
 class TestFullWorkflowIntegration:
-    """完全ワークフローの統合テスト"""
+    """完全ワークフローの統合テスト（ステップごとに独立して並列実行可能）"""
     
-    @pytest.mark.asyncio
-    async def test_complete_enhanced_workflow(self):
-        """全新機能を統合した完全ワークフローテスト"""
+    def test_workflow_config_step(self, workflow_components):
+        """設定管理ステップ"""
+        config = workflow_components['config_manager'].load_config()
         
-        # 1. 設定管理
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-            config_manager.save_config_template()
-            config = config_manager.load_config()
+        assert config.version == "3.0.0"
+    
+    def test_workflow_encoding_step(self, workflow_components):
+        """文字化け修正ステップ"""
+        test_data = [
+            {"title": "�A�I�L�������̃��X�g", "description": "‚±‚ê‚Í‚Ä‚·‚Æ"}
+        ]
         
-        # 2. ログシステム
-        logger = get_logger("workflow_test", LogLevel.INFO)
+        fixed_data = workflow_components['encoding_handler'].batch_fix_events(test_data)
         
-        # 3. エラーハンドリング
-        error_handler = ErrorHandler()
+        assert len(fixed_data) == 1
+        assert '�' not in fixed_data[0]['title']
+    
+    def test_workflow_metrics_step(self, workflow_components):
+        """ログ・メトリクスステップ"""
+        logger = workflow_components['logger']
+        op_context = logger.log_operation_start("full_workflow_test")
         
-        # 4. 文字化け修正
-        encoding_handler = EncodingHandler()
+        # 成功メトリクス記録
+        logger.metrics.record_success("data_processing", 1.2)
+        logger.log_operation_end(op_context, success=True, events_processed=1)
         
-        # 5. 模擬ワークフローの実行
+        # 健全性確認
+        health = logger.get_health_status()
+        assert health['overall_status'] in ['healthy', 'warning']
+    
+    @pytest.mark.asyncio
+    async def test_workflow_error_step(self, workflow_components):
+        """エラーハンドリングステップ"""
+        logger = workflow_components['logger']
         op_context = logger.log_operation_start("full_workflow_test")
         
-        try:
-            # 文字化けデータの修正
-            test_data = [
-                {"title": "�A�I�L�������̃��X�g", "description": "‚±‚ê‚Í‚Ä‚·‚Æ"}
-            ]
-            
-            fixed_data = encoding_handler.batch_fix_events(test_data)
-            
-            # 成功メトリクス記録
-            logger.metrics.record_success("data_processing", 1.2)
-            
-            logger.log_operation_end(op_context, success=True, 
-                                   events_processed=len(fixed_data))
-            
-            # 健全性確認
-            health = logger.get_health_status()
-            
-            # すべてが正常に動作することを確認
-            assert len(fixed_data) == 1
-            assert '�' not in fixed_data[0]['title']
-            assert health['overall_status'] in ['healthy', 'warning']
-            
-        except Exception as e:
-            # エラーハンドリング
-            recovery_result = await error_handler.handle_error(e, op_context)
-            logger.log_operation_end(op_context, success=False, error=str(e))
-            
-            # エラーが適切に処理されることを確認
-            assert recovery_result in RecoveryResult
+        error = RuntimeError("workflow step failed")
+        recovery_result = await workflow_components['error_handler'].handle_error(error, op_context)
+        logger.log_operation_end(op_context, success=False, error=str(error))
+        
+        # エラーが適切に処理されることを確認
+        assert recovery_result in RecoveryResult
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""
+マルチチャンネル配信システム テスト
+リトライ処理ワーカー（_retry_processor / _retry_delivery）の動作確認
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from time import perf_counter
+from typing import List
+
+# テスト対象モジュール
+from src.timetree_notifier.layers.notification_layer.multi_channel_dispatcher import (
+    NotificationDispatcher, NotificationChannel, NotificationMessage,
+    ChannelDeliveryResult, NotificationStatus
+)
+
+
+# リトライ前の指数バックオフ待機（秒）: backoff_base ** retry_count
+RETRY_BACKOFF = 0.5
+
+
+class RecordingChannel(NotificationChannel):
+    """送信したメッセージIDを記録する成功固定のチャンネル"""
+    
+    def __init__(self, name: str = "recording"):
+        super().__init__(name, {})
+        self.sent_ids: List[str] = []
+        self.sent = asyncio.Event()
+    
+    async def send_message(self, message: NotificationMessage) -> ChannelDeliveryResult:
+        self.sent_ids.append(message.id)
+        self.sent.set()
+        return ChannelDeliveryResult(
+            channel=self.name,
+            message_id=message.id,
+            status=NotificationStatus.SUCCESS,
+            attempt_time=datetime.now(),
+            processing_time=0.0
+        )
+
+
+def _retry_message(message_id: str, channel: str) -> NotificationMessage:
+    """1回目のリトライ待ちメッセージ"""
+    return NotificationMessage(
+        id=message_id,
+        content="リトライテスト",
+        channels=[channel],
+        retry_count=1,
+        max_retries=3
+    )
+
+
+def _build_dispatcher(backoff_base: float, max_concurrent: int = 10) -> NotificationDispatcher:
+    return NotificationDispatcher({
+        'retry_policy': {'backoff_base': backoff_base},
+        'max_concurrent_deliveries': max_concurrent
+    })
+
+
+class TestRetryProcessing:
+    """リトライ処理のテスト"""
+    
+    @pytest.mark.asyncio
+    async def test_retries_run_concurrently(self):
+        """キュー上の複数リトライがバックオフ待機を重ねて並行実行されることを確認"""
+        channel = RecordingChannel()
+        dispatcher = _build_dispatcher(RETRY_BACKOFF)
+        dispatcher.register_channel(channel)
+        
+        await dispatcher.retry_queue.put(_retry_message("retry_a", channel.name))
+        await dispatcher.retry_queue.put(_retry_message("retry_b", channel.name))
+        
+        start_time = perf_counter()
+        await dispatcher.start_background_processing()
+        try:
+            while len(channel.sent_ids) < 2:
+                channel.sent.clear()
+                await asyncio.wait_for(channel.sent.wait(), timeout=5.0)
+            elapsed = perf_counter() - start_time
+        finally:
+            await dispatcher.stop_background_processing()
+        
+        assert sorted(channel.sent_ids) == ["retry_a", "retry_b"]
+        # 逐次処理ならバックオフの合計以上かかる
+        assert elapsed < 2 * RETRY_BACKOFF
+    
+    @pytest.mark.asyncio
+    async def test_stop_cancels_inflight_retries(self):
+        """停止時にバックオフ待機中のリトライタスクがキャンセルされることを確認"""
+        channel = RecordingChannel()
+        dispatcher = _build_dispatcher(backoff_base=60.0)
+        dispatcher.register_channel(channel)
+        
+        await dispatcher.retry_queue.put(_retry_message("retry_pending", channel.name))
+        await dispatcher.start_background_processing()
+        
+        # リトライワーカー + リトライタスク1件が登録されるまで待機
+        async def wait_for_retry_task():
+            while len(dispatcher.background_tasks) < 2:
+                await asyncio.sleep(0.01)
+        
+        try:
+            await asyncio.wait_for(wait_for_retry_task(), timeout=5.0)
+        finally:
+            tasks = list(dispatcher.background_tasks)
+            await dispatcher.stop_background_processing()
+        
+        assert all(task.cancelled() for task in tasks)
+        assert not dispatcher.background_tasks
+        assert channel.sent_ids == []
+    
+    @pytest.mark.asyncio
+    async def test_retry_tasks_bounded_by_max_concurrent(self):
+        """同時に起動するリトライタスク数が max_concurrent_deliveries を超えないことを確認"""
+        channel = RecordingChannel()
+        dispatcher = _build_dispatcher(backoff_base=60.0, max_concurrent=2)
+        dispatcher.register_channel(channel)
+        
+        for index in range(5):
+            await dispatcher.retry_queue.put(_retry_message(f"retry_{index}", channel.name))
+        await dispatcher.start_background_processing()
+        
+        # リトライワーカー + 上限2件のリトライタスクが登録されるまで待機
+        async def wait_for_retry_tasks():
+            while len(dispatcher.background_tasks) < 3:
+                await asyncio.sleep(0.01)
+        
+        try:
+            await asyncio.wait_for(wait_for_retry_tasks(), timeout=5.0)
+            await asyncio.sleep(0.1)
+            retry_task_count = len(dispatcher.background_tasks) - 1
+        finally:
+            await dispatcher.stop_background_processing()
+        
+        assert retry_task_count == 2
+        # 3件目は取り出し済みで空き待ち、残りはキューに滞留
+        assert dispatcher.retry_queue.qsize() == 2
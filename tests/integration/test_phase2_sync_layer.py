@@ -1,12 +1,20 @@
 """
 Phase 2 同期層 統合テスト
 Google Calendar連携・競合解決・データベースの統合動作確認
+
+各テストクラスは独立しているため並列実行可能:
+    pytest -n auto --dist=loadscope tests/integration
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import tempfile
+import threading
+import uuid
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from typing import Optional
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 import sys
@@ -17,54 +25,100 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from timetree_notifier.layers.sync_layer.event_storage import EventStorage, StoredEvent, SyncStatus, NotificationQueue, NotificationStatus
 from timetree_notifier.layers.sync_layer.conflict_resolver import ConflictResolver, ConflictStrategy, ConflictType
+from timetree_notifier.utils.compat import DATACLASS_SLOTS
+
+
+# テストで共通利用する固定日時
+SEP1_0000 = datetime(2025, 9, 1, 0, 0)
+SEP1_1000 = datetime(2025, 9, 1, 10, 0)
+SEP1_1005 = datetime(2025, 9, 1, 10, 5)
+SEP1_1010 = datetime(2025, 9, 1, 10, 10)
+SEP1_1100 = datetime(2025, 9, 1, 11, 0)
+SEP1_1400 = datetime(2025, 9, 1, 14, 0)
+SEP1_1405 = datetime(2025, 9, 1, 14, 5)
+SEP1_1500 = datetime(2025, 9, 1, 15, 0)
+SEP1_2359 = datetime(2025, 9, 1, 23, 59)
+SEP2_1400 = datetime(2025, 9, 2, 14, 0)
+SEP2_1500 = datetime(2025, 9, 2, 15, 0)
 
 
+def _one_hour_later() -> datetime:
+    return datetime.now() + timedelta(hours=1)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MockTimeTreeEvent:
     """テスト用TimeTreeイベント"""
-    def __init__(self, **kwargs):
-        self.id = kwargs.get('id', 'tt_001')
-        self.title = kwargs.get('title', 'テストイベント')
-        self.start_time = kwargs.get('start_time', datetime.now() + timedelta(hours=1))
-        self.end_time = kwargs.get('end_time', None)
-        self.is_all_day = kwargs.get('is_all_day', False)
-        self.description = kwargs.get('description', '')
-        self.location = kwargs.get('location', '')
+    id: str = 'tt_001'
+    title: str = 'テストイベント'
+    start_time: datetime = field(default_factory=_one_hour_later)
+    end_time: Optional[datetime] = None
+    is_all_day: bool = False
+    description: str = ''
+    location: str = ''
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MockGoogleCalendarEvent:
     """テスト用Google Calendarイベント"""
-    def __init__(self, **kwargs):
-        self.id = kwargs.get('id', 'gc_001')
-        self.summary = kwargs.get('summary', 'テストイベント')
-        self.start = kwargs.get('start', datetime.now() + timedelta(hours=1))
-        self.end = kwargs.get('end', None)
-        self.all_day = kwargs.get('all_day', False)
-        self.description = kwargs.get('description', '')
-        self.location = kwargs.get('location', '')
-        self.source_event_id = kwargs.get('source_event_id', None)
-        self.created = kwargs.get('created', datetime.now())
-        self.updated = kwargs.get('updated', datetime.now())
+    id: str = 'gc_001'
+    summary: str = 'テストイベント'
+    start: datetime = field(default_factory=_one_hour_later)
+    end: Optional[datetime] = None
+    all_day: bool = False
+    description: str = ''
+    location: str = ''
+    source_event_id: Optional[str] = None
+    created: datetime = field(default_factory=datetime.now)
+    updated: datetime = field(default_factory=datetime.now)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """セッション共有イベントループ（セッションスコープの非同期フィクスチャ用）"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_storage():
+    """セッション共有インメモリストレージ（DDLはセッションで1回だけ実行、ディスクI/Oなし）"""
+    storage = EventStorage("file:teststorage?mode=memory&cache=shared")
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+async def _clear_storage(storage: EventStorage):
+    """テスト間の分離のため全テーブルの行を削除"""
+    async with storage._connection() as db:
+        await db.execute("DELETE FROM sync_logs")
+        await db.execute("DELETE FROM notification_queue")
+        await db.execute("DELETE FROM events")
+        await db.commit()
 
 
 class TestEventStorage:
     """イベントストレージのテスト"""
     
+    @pytest.fixture(autouse=True)
+    async def _clean_storage(self, session_storage):
+        await _clear_storage(session_storage)
+    
     @pytest.fixture
-    async def temp_storage(self):
-        """テンポラリストレージ"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            storage = EventStorage(Path(temp_dir) / "test.db")
-            await storage.initialize()
-            yield storage
+    def temp_storage(self, session_storage):
+        """テスト毎に空にしたセッション共有ストレージ"""
+        return session_storage
     
     @pytest.fixture
     def sample_event(self):
         """サンプルイベント"""
         return StoredEvent(
-            id="test_001",
+            id=f"test_001_{uuid.uuid4().hex}",
             title="サンプルイベント",
-            start_datetime=datetime(2025, 9, 1, 10, 0),
-            end_datetime=datetime(2025, 9, 1, 11, 0),
+            start_datetime=SEP1_1000,
+            end_datetime=SEP1_1100,
             is_all_day=False,
             description="テスト用イベント",
             location="テスト会場",
@@ -108,8 +162,8 @@ class TestEventStorage:
         event2 = StoredEvent(
             id="test_002",
             title="別のイベント",
-            start_datetime=datetime(2025, 9, 2, 14, 0),
-            end_datetime=datetime(2025, 9, 2, 15, 0),
+            start_datetime=SEP2_1400,
+            end_datetime=SEP2_1500,
             is_all_day=False,
             description="",
             location="",
@@ -119,22 +173,112 @@ class TestEventStorage:
             sync_status=SyncStatus.SUCCESS
         )
         
-        await temp_storage.store_event(event1)
-        await temp_storage.store_event(event2)
+        await temp_storage.store_events([event1, event2])
         
         # 日付範囲フィルタ
         events_sep1 = await temp_storage.get_events(
-            start_date=datetime(2025, 9, 1, 0, 0),
-            end_date=datetime(2025, 9, 1, 23, 59)
+            start_date=SEP1_0000,
+            end_date=SEP1_2359
         )
         assert len(events_sep1) == 1
-        assert events_sep1[0].id == "test_001"
+        assert events_sep1[0].id == event1.id
         
         # ステータスフィルタ
         pending_events = await temp_storage.get_events(sync_status=SyncStatus.PENDING)
         assert len(pending_events) == 1
         assert pending_events[0].sync_status == SyncStatus.PENDING
     
+    @pytest.mark.asyncio
+    async def test_storage_context_manager(self, tmp_path):
+        """async with 終了時に共有接続がクローズされることを確認"""
+        database_path = tmp_path / "context.db"
+        async with EventStorage(database_path) as storage:
+            assert await storage.initialize()
+            assert storage._connection_pool is not None
+        
+        assert storage._connection_pool is None
+        database_path.unlink()
+    
+    def test_unclosed_storage_closed_on_loop_shutdown(self, tmp_path):
+        """close() を呼ばなくてもループ終了時に接続とワーカースレッドが解放されることを確認"""
+        storage = EventStorage(tmp_path / "unclosed.db")
+        threads_before = set(threading.enumerate())
+        
+        async def use_without_close():
+            assert await storage.initialize()
+            await storage.get_storage_statistics()
+            return [t for t in threading.enumerate() if t not in threads_before]
+        
+        worker_threads = asyncio.run(use_without_close())
+        
+        assert worker_threads
+        assert storage._connection_pool is None
+        for thread in worker_threads:
+            thread.join(timeout=5.0)
+            assert not thread.is_alive()
+    
+    @pytest.mark.asyncio
+    async def test_rollback_on_cancel(self, temp_storage, sample_event):
+        """操作途中でキャンセルされた変更が後続のコミットに混入しないことを確認"""
+        inserted = asyncio.Event()
+        
+        async def interrupted_store():
+            async with temp_storage._connection() as db:
+                await temp_storage._insert_event(sample_event, db)
+                inserted.set()
+                await asyncio.Event().wait()
+        
+        task = asyncio.create_task(interrupted_store())
+        await inserted.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        other_event = replace(sample_event, id=f"test_other_{uuid.uuid4().hex}")
+        assert await temp_storage.store_event(other_event)
+        
+        events = await temp_storage.get_events()
+        assert [event.id for event in events] == [other_event.id]
+    
+    @pytest.mark.asyncio
+    async def test_store_events_batch_upsert(self, temp_storage, sample_event):
+        """一括保存テスト（既存IDの更新・新規作成・同一バッチ内の重複ID）"""
+        event1 = sample_event
+        event2 = replace(sample_event, id=f"test_002_{uuid.uuid4().hex}", title="二件目")
+        assert await temp_storage.store_events([event1, event2])
+        
+        # 既存2件を変更して再保存し、新規1件を追加（新規IDはバッチ内で重複させる）
+        updated1 = replace(event1, title="更新後", sync_status=SyncStatus.SUCCESS)
+        updated2 = replace(event2, location="更新後の会場")
+        event3 = replace(sample_event, id=f"test_003_{uuid.uuid4().hex}", title="三件目")
+        event3_dup = replace(event3, title="三件目（重複）")
+        assert await temp_storage.store_events([updated1, updated2, event3, event3_dup])
+        
+        events = {event.id: event for event in await temp_storage.get_events()}
+        assert len(events) == 3
+        assert events[event1.id].title == "更新後"
+        assert events[event1.id].sync_status == SyncStatus.SUCCESS
+        assert events[event2.id].location == "更新後の会場"
+        assert events[event3.id].title == "三件目（重複）"
+        
+        # 同期ログのアクション（イベントごと）
+        actions = {}
+        for log in await temp_storage.get_sync_logs():
+            actions.setdefault(log.event_id, []).append(log.action)
+        assert sorted(actions[event1.id]) == ["CREATE", "UPDATE"]
+        assert sorted(actions[event2.id]) == ["CREATE", "UPDATE"]
+        assert sorted(actions[event3.id]) == ["CREATE", "UPDATE"]
+    
+    @pytest.mark.asyncio
+    async def test_store_events_many_ids(self, temp_storage, sample_event):
+        """バインド変数の上限（999）を超える件数の一括保存テスト"""
+        events = [replace(sample_event, id=f"bulk_{i:04d}") for i in range(1200)]
+        assert await temp_storage.store_events(events)
+        assert await temp_storage.store_events(events)
+        
+        stats = await temp_storage.get_storage_statistics()
+        assert stats['total_events'] == 1200
+    
     @pytest.mark.asyncio
     async def test_sync_logging(self, temp_storage, sample_event):
         """同期ログテスト"""
@@ -224,13 +368,13 @@ class TestConflictResolver:
         # 類似イベント
         tt_event = MockTimeTreeEvent(
             title="定例会議",
-            start_time=datetime(2025, 9, 1, 10, 0),
+            start_time=SEP1_1000,
             location="会議室A"
         )
         
         gc_event = MockGoogleCalendarEvent(
             summary="📱 定例会議",
-            start=datetime(2025, 9, 1, 10, 5),  # 5分のずれ
+            start=SEP1_1005,  # 5分のずれ
             location="会議室A"
         )
         
@@ -240,7 +384,7 @@ class TestConflictResolver:
         # 異なるイベント
         different_event = MockGoogleCalendarEvent(
             summary="別のイベント",
-            start=datetime(2025, 9, 1, 15, 0),
+            start=SEP1_1500,
             location="別の場所"
         )
         
@@ -255,7 +399,7 @@ class TestConflictResolver:
             MockTimeTreeEvent(
                 id="tt_001",
                 title="会議A",
-                start_time=datetime(2025, 9, 1, 10, 0),
+                start_time=SEP1_1000,
                 description="TimeTree側の説明"
             )
         ]
@@ -264,7 +408,7 @@ class TestConflictResolver:
             MockGoogleCalendarEvent(
                 id="gc_001",
                 summary="📱 会議A",
-                start=datetime(2025, 9, 1, 10, 10),  # 10分のずれ
+                start=SEP1_1010,  # 10分のずれ
                 description="Google側の説明",
                 source_event_id="tt_001"  # 関連付け
             )
@@ -319,25 +463,27 @@ class TestConflictResolver:
 class TestSyncLayerIntegration:
     """同期層統合テスト"""
     
+    @pytest.fixture(autouse=True)
+    async def _clean_storage(self, session_storage):
+        await _clear_storage(session_storage)
+    
     @pytest.fixture
-    async def integrated_system(self):
+    def integrated_system(self, session_storage):
         """統合システムのセットアップ"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # ストレージ初期化
-            storage = EventStorage(Path(temp_dir) / "integration_test.db")
-            await storage.initialize()
-            
-            # 競合解決器
-            resolver = ConflictResolver({
-                'strategy': 'merge',
-                'auto_resolve_threshold': 2.0,
-                'similarity_threshold': 0.7
-            })
-            
-            yield {
-                'storage': storage,
-                'resolver': resolver
-            }
+        # ストレージ（セッション共有・テスト毎に空）
+        storage = session_storage
+        
+        # 競合解決器
+        resolver = ConflictResolver({
+            'strategy': 'merge',
+            'auto_resolve_threshold': 2.0,
+            'similarity_threshold': 0.7
+        })
+        
+        return {
+            'storage': storage,
+            'resolver': resolver
+        }
     
     @pytest.mark.asyncio
     async def test_full_sync_workflow(self, integrated_system):
@@ -349,7 +495,7 @@ class TestSyncLayerIntegration:
         tt_event = MockTimeTreeEvent(
             id="workflow_001",
             title="ワークフローテスト",
-            start_time=datetime(2025, 9, 1, 14, 0),
+            start_time=SEP1_1400,
             description="統合テスト用イベント",
             location="テストルーム"
         )
@@ -376,7 +522,7 @@ class TestSyncLayerIntegration:
         gc_event = MockGoogleCalendarEvent(
             id="gc_workflow_001",
             summary="📱 ワークフローテスト",
-            start=datetime(2025, 9, 1, 14, 5),  # 5分のずれ
+            start=SEP1_1405,  # 5分のずれ
             description="Google側の説明",
             location="テストルーム",
             source_event_id="workflow_001"
@@ -390,8 +536,9 @@ class TestSyncLayerIntegration:
         
         # 5. 解決結果をストレージに更新
         if resolved:
+            updated_events = []
             for resolved_event in resolved:
-                updated_stored = StoredEvent(
+                updated_events.append(StoredEvent(
                     id=getattr(resolved_event, 'id', stored_event.id),
                     title=getattr(resolved_event, 'title', stored_event.title),
                     start_datetime=getattr(resolved_event, 'start_time', stored_event.start_datetime),
@@ -403,9 +550,9 @@ class TestSyncLayerIntegration:
                     created_at=stored_event.created_at,
                     updated_at=datetime.now(),
                     sync_status=SyncStatus.SUCCESS
-                )
-                
-                await storage.store_event(updated_stored)
+                ))
+            
+            await storage.store_events(updated_events)
         
         # 6. 最終確認
         final_events = await storage.get_events()
@@ -431,32 +578,33 @@ if __name__ == "__main__":
         # ストレージテスト
         print("\n📦 Testing Event Storage...")
         with tempfile.TemporaryDirectory() as temp_dir:
-            storage = EventStorage(Path(temp_dir) / "basic_test.db")
-            if await storage.initialize():
-                print("✅ Storage initialization successful")
-                
-                # サンプルイベント
-                event = StoredEvent(
-                    id="basic_001",
-                    title="基本テスト",
-                    start_datetime=datetime.now() + timedelta(hours=1),
-                    end_datetime=datetime.now() + timedelta(hours=2),
-                    is_all_day=False,
-                    description="基本機能テスト",
-                    location="",
-                    source_hash="basic_hash",
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    sync_status=SyncStatus.PENDING
-                )
-                
-                if await storage.store_event(event):
-                    print("✅ Event storage successful")
-                
-                events = await storage.get_events()
-                print(f"✅ Event retrieval successful: {len(events)} events")
-            else:
-                print("❌ Storage initialization failed")
+            # 一時ディレクトリ削除前に接続をクローズ（Windowsでは開いたままだと削除できない）
+            async with EventStorage(Path(temp_dir) / "basic_test.db") as storage:
+                if await storage.initialize():
+                    print("✅ Storage initialization successful")
+                    
+                    # サンプルイベント
+                    event = StoredEvent(
+                        id="basic_001",
+                        title="基本テスト",
+                        start_datetime=datetime.now() + timedelta(hours=1),
+                        end_datetime=datetime.now() + timedelta(hours=2),
+                        is_all_day=False,
+                        description="基本機能テスト",
+                        location="",
+                        source_hash="basic_hash",
+                        created_at=datetime.now(),
+                        updated_at=datetime.now(),
+                        sync_status=SyncStatus.PENDING
+                    )
+                    
+                    if await storage.store_event(event):
+                        print("✅ Event storage successful")
+                    
+                    events = await storage.get_events()
+                    print(f"✅ Event retrieval successful: {len(events)} events")
+                else:
+                    print("❌ Storage initialization failed")
         
         # 競合解決テスト
         print("\n⚡ Testing Conflict Resolution...")